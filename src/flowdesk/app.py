@@ -32,7 +32,9 @@ from flowdesk.services.tray_ui_service import TrayUIService
 from flowdesk.services.stylesheet_service import StylesheetService
 from flowdesk.utils.resource_path import resource_path
 from flowdesk.utils.logger import setup_logging, get_logger
-from flowdesk.utils.admin_utils import ensure_admin_privileges, get_elevation_status_message
+from flowdesk.utils.admin_utils import (
+    ensure_admin_privileges, get_elevation_status_message, prefetch_network_admin_capability
+)
 
 
 class FlowDeskApplication:
@@ -111,6 +113,9 @@ class FlowDeskApplication:
             else:
                 self.logger.info("已获得管理员权限，网络配置功能可正常使用")
             
+            # 后台预探测网络配置能力，避免启动完成时主线程阻塞在netsh上
+            prefetch_network_admin_capability()
+            
             # 设置应用程序基本信息
             self.app.setApplicationName("FlowDesk")
             self.app.setApplicationVersion("1.0.0")
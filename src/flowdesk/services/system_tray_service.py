@@ -17,6 +17,8 @@ UI操作由TrayUIService处理，本服务只负责业务逻辑协调。
 - 提供业务逻辑的统一管理
 """
 
+from collections.abc import Mapping
+
 from PyQt5.QtCore import QObject, pyqtSignal
 from ..utils.logger import get_logger
 from ..utils.capabilities import get_system_capabilities
@@ -57,8 +59,8 @@ class SystemTrayService(QObject):
             # 检查系统能力
             capabilities = get_system_capabilities()
             # 系统托盘功能基于PyQt可用性判断
-            # pyqt_available是字典类型，需要提取available字段
-            if isinstance(capabilities.pyqt_available, dict):
+            # pyqt_available是只读映射类型，需要提取available字段
+            if isinstance(capabilities.pyqt_available, Mapping):
                 self._is_tray_available = capabilities.pyqt_available.get('available', False)
             else:
                 self._is_tray_available = bool(capabilities.pyqt_available)
@@ -15,9 +15,84 @@ FlowDesk 自定义验证器模块
 - 可复用性：验证器可被应用到任何QLineEdit控件，实现UI组件的标准化和代码复用。
 """
 
+from functools import lru_cache
+
 from PyQt5.QtGui import QValidator
 from PyQt5.QtCore import pyqtSignal, QObject
-from ...utils.network_utils import validate_subnet_mask
+
+from ...utils.ip_validation_utils import validate_subnet_mask
+
+
+def _parse_decimal(digits: str, upper: int) -> int:
+    """
+    逐字符解析ASCII十进制数字串
+
+    一次遍历同时完成"是否全为数字"和"是否超出上限"两项检查，
+    替代 isdigit() + int() 的两次遍历，供验证器在每次按键时调用。
+
+    参数说明：
+        digits (str): 待解析的数字串（如IP段或CIDR前缀）
+        upper (int): 允许的最大数值
+
+    返回值：
+        int: 解析出的数值；包含非数字字符或超过上限时返回-1
+    """
+    value = 0
+    for char in digits:
+        digit = ord(char) - 48
+        if not 0 <= digit <= 9:
+            return -1
+        value = value * 10 + digit
+        if value > upper:
+            return -1
+    return value
+
+
+@lru_cache(maxsize=256)
+def _scan_dotted_quad(text: str) -> int:
+    """
+    单次遍历扫描点分十进制输入，返回对应的验证状态
+
+    扫描过程中只维护点的数量、当前段的数值和位数几个标量，
+    一次遍历即可完成段数、空段、非数字字符和0-255范围的全部检查，
+    无需先split成列表再逐段检查、最后再对列表做一次all()判断。
+
+    结果只取决于输入文本，因此按文本缓存：QLineEdit在光标移动、
+    失焦和hasAcceptableInput等场景会对同一文本反复调用validate，
+    命中缓存时直接返回，不再进入逐字符循环。
+
+    参数说明：
+        text (str): 非空的输入文本
+
+    返回值：
+        int: QValidator.Invalid / Intermediate / Acceptable
+             Acceptable表示已输入完整的4段且每段都合法
+    """
+    dots = 0
+    value = 0
+    digits = 0
+    for char in text:
+        if char == '.':
+            # 点之前的段不能为空（例如 "192..1.1" 或 ".1"），且最多3个点
+            if not digits or dots == 3:
+                return QValidator.Invalid
+            dots += 1
+            value = 0
+            digits = 0
+            continue
+
+        digit = ord(char) - 48
+        if not 0 <= digit <= 9:
+            return QValidator.Invalid
+        value = value * 10 + digit
+        if value > 255:
+            return QValidator.Invalid
+        digits += 1
+
+    # 3个点且最后一段非空即为完整格式，其余情况（如 "192.168."）为中间状态
+    if dots == 3 and digits:
+        return QValidator.Acceptable
+    return QValidator.Intermediate
 
 
 class IPAddressValidator(QValidator):
@@ -65,48 +140,16 @@ class IPAddressValidator(QValidator):
         if not input_text:
             return (QValidator.Intermediate, input_text, pos)
 
-        # 使用点（.）分割字符串，得到IP地址的各个段
-        octets = input_text.split('.')
-
-        # 检查段数是否超过4个，超过则无效
-        if len(octets) > 4:
+        # 单次遍历完成段数、空段、数字和0-255范围检查
+        # 这是实现“实时禁止”的核心，例如输入“257”时，
+        # 当输入'7'后，段值变成257，超过255，返回Invalid
+        state = _scan_dotted_quad(input_text)
+        if state == QValidator.Invalid:
             # 发射验证错误信号用于UI提示
             self.validation_error.emit(input_text)
-            return (QValidator.Invalid, input_text, pos)
-
-        # 逐个检查每个段的有效性
-        for i, octet in enumerate(octets):
-            # 段内不能为空，除非是最后一段且整个IP未输入完整
-            if not octet:
-                # 如果空段不是最后一段（例如 "192..1.1"），则无效
-                if i < len(octets) - 1:
-                    # 发射验证错误信号用于UI提示
-                    self.validation_error.emit(input_text)
-                    return (QValidator.Invalid, input_text, pos)
-                # 如果是最后一段为空（例如 "192.168.1."），是合法的中间状态
-                continue
-
-            # 检查段内是否只包含数字
-            if not octet.isdigit():
-                # 发射验证错误信号用于UI提示
-                self.validation_error.emit(input_text)
-                return (QValidator.Invalid, input_text, pos)
 
-            # 检查段的数值是否在0-255之间
-            # 这是实现“实时禁止”的核心，例如输入“257”时，
-            # 当输入'7'后，int(octet)会变成257，判断>255，返回Invalid
-            if int(octet) > 255:
-                # 发射验证错误信号用于UI提示
-                self.validation_error.emit(input_text)
-                return (QValidator.Invalid, input_text, pos)
-
-        # 检查IP地址是否是一个完整且合法的格式
-        # 必须有4个段，且最后一位不能是点
-        if len(octets) == 4 and all(octet for octet in octets) and not input_text.endswith('.'):
-            return (QValidator.Acceptable, input_text, pos)
-        else:
-            # 其他所有情况（例如 "192.168." 或 "192.168.1.10"）都视为合法的中间状态
-            return (QValidator.Intermediate, input_text, pos)
+        # 完整的4段格式为Acceptable，其他情况（例如 "192.168."）为中间状态
+        return (state, input_text, pos)
 
 
 class SubnetMaskValidator(QValidator):
@@ -162,45 +205,21 @@ class SubnetMaskValidator(QValidator):
             if not cidr_part:
                 return (QValidator.Intermediate, input_text, pos)
             
-            # 检查是否只包含数字
-            if not cidr_part.isdigit():
-                return (QValidator.Invalid, input_text, pos)
-            
-            # 检查CIDR值范围（0-32）
-            cidr_value = int(cidr_part)
-            if cidr_value > 32:
+            # 检查是否只包含数字，且CIDR值在0-32之间
+            if _parse_decimal(cidr_part, 32) < 0:
                 return (QValidator.Invalid, input_text, pos)
             
             # 完整的CIDR格式
             return (QValidator.Acceptable, input_text, pos)
 
-        # 处理点分十进制格式
-        octets = input_text.split('.')
-        
-        # 超过4段无效
-        if len(octets) > 4:
+        # 处理点分十进制格式：单次遍历检查段数、空段、数字和0-255范围
+        state = _scan_dotted_quad(input_text)
+        if state == QValidator.Invalid:
             return (QValidator.Invalid, input_text, pos)
 
-        # 检查每个段
-        for i, octet in enumerate(octets):
-            # 空段处理
-            if not octet:
-                # 非最后段为空无效（如 "255..255.0"）
-                if i < len(octets) - 1:
-                    return (QValidator.Invalid, input_text, pos)
-                continue
-
-            # 只允许数字
-            if not octet.isdigit():
-                return (QValidator.Invalid, input_text, pos)
-
-            # 数值范围检查（0-255）
-            if int(octet) > 255:
-                return (QValidator.Invalid, input_text, pos)
-
         # 完整的4段点分十进制格式需要进一步验证
-        if len(octets) == 4 and all(octet for octet in octets) and not input_text.endswith('.'):
-            # 使用network_utils验证是否为有效子网掩码
+        if state == QValidator.Acceptable:
+            # 验证是否为有效子网掩码（带缓存的33个标准掩码查表）
             if validate_subnet_mask(input_text):
                 return (QValidator.Acceptable, input_text, pos)
             else:
@@ -232,10 +251,8 @@ class DNSValidator(QValidator):
         dns_input.setValidator(dns_validator)
     """
 
-    def __init__(self):
-        """初始化DNS验证器，内部使用IP地址验证器"""
-        super().__init__()
-        self._ip_validator = IPAddressValidator()
+    # 内部委托的IP地址验证器，无状态，所有DNS验证器实例共享同一个
+    _ip_validator = IPAddressValidator()
 
     def validate(self, input_text: str, pos: int) -> tuple:
         """
@@ -19,7 +19,77 @@
 import sys
 import os
 import ctypes
+import ctypes.wintypes
 import subprocess
+import threading
+from typing import Optional
+
+
+# ShellExecuteExW 参数常量
+SEE_MASK_NOCLOSEPROCESS = 0x00000040  # 返回新进程句柄，便于确认子进程已启动
+SEE_MASK_NO_CONSOLE = 0x00008000      # 不为新进程继承当前控制台
+SW_HIDE = 0
+SW_SHOWNORMAL = 1
+ELEVATED_PROCESS_IDLE_TIMEOUT_MS = 5000  # WaitForInputIdle 最长等待时间（仅对GUI进程生效）
+WAIT_TIMEOUT = 0x00000102  # WaitForSingleObject 等待超时的返回值
+MAX_WAIT_MS = 0xFFFFFFFE   # 最大有限等待时间（0xFFFFFFFF 表示无限等待）
+
+
+class _ShellExecuteInfo(ctypes.Structure):
+    """Windows SHELLEXECUTEINFOW 结构体，供 ShellExecuteExW 使用"""
+    _fields_ = [
+        ("cbSize", ctypes.wintypes.DWORD),
+        ("fMask", ctypes.wintypes.ULONG),
+        ("hwnd", ctypes.wintypes.HWND),
+        ("lpVerb", ctypes.wintypes.LPCWSTR),
+        ("lpFile", ctypes.wintypes.LPCWSTR),
+        ("lpParameters", ctypes.wintypes.LPCWSTR),
+        ("lpDirectory", ctypes.wintypes.LPCWSTR),
+        ("nShow", ctypes.c_int),
+        ("hInstApp", ctypes.wintypes.HINSTANCE),
+        ("lpIDList", ctypes.c_void_p),
+        ("lpClass", ctypes.wintypes.LPCWSTR),
+        ("hkeyClass", ctypes.wintypes.HKEY),
+        ("dwHotKey", ctypes.wintypes.DWORD),
+        ("hIconOrMonitor", ctypes.wintypes.HANDLE),
+        ("hProcess", ctypes.wintypes.HANDLE),
+    ]
+
+
+# 提权执行所需的Windows API，导入时解析一次并声明原型，确保句柄按HANDLE类型传递；
+# 使用独立的WinDLL实例，不修改ctypes.windll上与其他模块共享的函数对象
+if sys.platform == 'win32':
+    _shell32 = ctypes.WinDLL('shell32')
+    _kernel32 = ctypes.WinDLL('kernel32')
+    _user32 = ctypes.WinDLL('user32')
+    
+    _ShellExecuteExW = _shell32.ShellExecuteExW
+    _ShellExecuteExW.argtypes = [ctypes.POINTER(_ShellExecuteInfo)]
+    _ShellExecuteExW.restype = ctypes.wintypes.BOOL
+    
+    _WaitForSingleObject = _kernel32.WaitForSingleObject
+    _WaitForSingleObject.argtypes = [ctypes.wintypes.HANDLE, ctypes.wintypes.DWORD]
+    _WaitForSingleObject.restype = ctypes.wintypes.DWORD
+    
+    _GetExitCodeProcess = _kernel32.GetExitCodeProcess
+    _GetExitCodeProcess.argtypes = [ctypes.wintypes.HANDLE, ctypes.POINTER(ctypes.wintypes.DWORD)]
+    _GetExitCodeProcess.restype = ctypes.wintypes.BOOL
+    
+    _CloseHandle = _kernel32.CloseHandle
+    _CloseHandle.argtypes = [ctypes.wintypes.HANDLE]
+    _CloseHandle.restype = ctypes.wintypes.BOOL
+    
+    # WaitForInputIdle由user32导出，而非kernel32
+    _WaitForInputIdle = _user32.WaitForInputIdle
+    _WaitForInputIdle.argtypes = [ctypes.wintypes.HANDLE, ctypes.wintypes.DWORD]
+    _WaitForInputIdle.restype = ctypes.wintypes.DWORD
+else:
+    _ShellExecuteExW = None
+
+
+# 网络管理能力探测结果缓存（提权后在进程生命周期内不会变化）
+_network_admin_capability = None
+_network_admin_capability_lock = threading.Lock()
 
 
 def is_admin() -> bool:
@@ -48,8 +118,10 @@ def run_as_admin(script_path: str = None) -> bool:
     """
     以管理员权限重新启动当前应用程序
     
-    使用Windows ShellExecute API以管理员权限重新启动程序。
+    使用Windows ShellExecuteEx API以管理员权限重新启动程序。
     这会触发UAC对话框，要求用户确认权限提升。
+    启动后通过WaitForInputIdle短暂等待：新进程为GUI程序（如pythonw.exe）时
+    等到其消息循环空闲；控制台程序（python.exe）没有消息循环，会立即返回。
     
     Args:
         script_path (str, optional): 要以管理员权限运行的脚本路径
@@ -61,35 +133,106 @@ def run_as_admin(script_path: str = None) -> bool:
     Note:
         成功启动管理员进程后，当前进程应该退出
     """
+    if _ShellExecuteExW is None:
+        return False
+    
     try:
         # 确定要重新启动的脚本路径
         if script_path is None:
             script_path = sys.argv[0]
         
-        # 获取Python解释器路径
-        python_exe = sys.executable
-        
         # 构建命令行参数
-        # 保持原有的命令行参数，确保程序行为一致
-        params = ' '.join([f'"{script_path}"'] + sys.argv[1:])
+        # 保持原有的命令行参数，list2cmdline按Windows规则转义空格和引号
+        params = subprocess.list2cmdline([script_path] + sys.argv[1:])
         
-        # 使用ShellExecute API以管理员权限启动进程
-        # "runas"动词会触发UAC权限提升对话框
-        result = ctypes.windll.shell32.ShellExecuteW(
-            None,                    # hwnd: 父窗口句柄
-            "runas",                # lpOperation: 操作类型（runas表示以管理员身份运行）
-            python_exe,             # lpFile: 要执行的程序
-            params,                 # lpParameters: 命令行参数
-            None,                   # lpDirectory: 工作目录
-            1                       # nShowCmd: 显示方式（1=SW_SHOWNORMAL）
-        )
+        # 填充ShellExecuteEx参数，"runas"动词会触发UAC权限提升对话框
+        execute_info = _ShellExecuteInfo()
+        execute_info.cbSize = ctypes.sizeof(execute_info)
+        execute_info.fMask = SEE_MASK_NOCLOSEPROCESS | SEE_MASK_NO_CONSOLE
+        execute_info.lpVerb = "runas"
+        execute_info.lpFile = sys.executable  # 使用当前Python解释器
+        execute_info.lpParameters = params
+        execute_info.nShow = SW_SHOWNORMAL
         
-        # ShellExecute返回值大于32表示成功
-        return result > 32
+        # 用户拒绝UAC或启动失败时ShellExecuteExW返回0
+        if not _ShellExecuteExW(ctypes.byref(execute_info)):
+            return False
         
     except Exception as e:
         print(f"以管理员权限启动失败: {e}")
         return False
+    
+    # 提权进程已经启动，之后无论等待是否成功都必须返回True，
+    # 否则调用方不会退出，提权与未提权的两个实例将同时运行
+    if execute_info.hProcess:
+        try:
+            _WaitForInputIdle(execute_info.hProcess, ELEVATED_PROCESS_IDLE_TIMEOUT_MS)
+        except Exception as e:
+            print(f"等待管理员进程初始化失败: {e}")
+        finally:
+            _CloseHandle(execute_info.hProcess)
+    
+    return True
+
+
+def can_run_elevated_process() -> bool:
+    """
+    检查run_elevated_process所需的ShellExecuteExW接口是否可用
+    
+    Returns:
+        bool: True表示可以通过run_elevated_process提权执行
+    """
+    return _ShellExecuteExW is not None
+
+
+def run_elevated_process(file: str, parameters: str, timeout: float) -> Optional[int]:
+    """
+    以管理员权限启动进程并等待其结束
+    
+    直接调用ShellExecuteExW的"runas"动词触发UAC提升，
+    无需经过PowerShell的Start-Process中转。新进程窗口隐藏。
+    
+    Args:
+        file (str): 要启动的程序，例如 "cmd.exe"
+        parameters (str): 命令行参数
+        timeout (float): 等待进程结束的超时时间（秒）
+    
+    Returns:
+        Optional[int]: 进程退出码；用户拒绝UAC或启动失败时返回None
+        
+    Raises:
+        subprocess.TimeoutExpired: 超时时进程仍未结束（提权进程不会被终止）
+        OSError: ShellExecuteExW接口不可用（调用前应先检查can_run_elevated_process）
+    """
+    if _ShellExecuteExW is None:
+        raise OSError("ShellExecuteExW不可用")
+    
+    execute_info = _ShellExecuteInfo()
+    execute_info.cbSize = ctypes.sizeof(execute_info)
+    execute_info.fMask = SEE_MASK_NOCLOSEPROCESS | SEE_MASK_NO_CONSOLE
+    execute_info.lpVerb = "runas"
+    execute_info.lpFile = file
+    execute_info.lpParameters = parameters
+    execute_info.nShow = SW_HIDE
+    
+    # 用户拒绝UAC或启动失败时ShellExecuteExW返回0
+    if not _ShellExecuteExW(ctypes.byref(execute_info)):
+        return None
+    if not execute_info.hProcess:
+        return None
+    
+    try:
+        timeout_ms = min(max(int(timeout * 1000), 0), MAX_WAIT_MS)
+        wait_result = _WaitForSingleObject(execute_info.hProcess, timeout_ms)
+        if wait_result == WAIT_TIMEOUT:
+            raise subprocess.TimeoutExpired(f"{file} {parameters}", timeout)
+        
+        exit_code = ctypes.wintypes.DWORD()
+        if not _GetExitCodeProcess(execute_info.hProcess, ctypes.byref(exit_code)):
+            raise ctypes.WinError()
+        return exit_code.value
+    finally:
+        _CloseHandle(execute_info.hProcess)
 
 
 def ensure_admin_privileges() -> bool:
@@ -148,6 +291,46 @@ def check_network_admin_capability() -> bool:
     通过尝试执行一个安全的netsh命令来验证是否具有网络配置权限。
     这比简单的管理员权限检查更准确，因为某些企业环境可能有特殊的权限策略。
     
+    探测结果在本次会话内缓存，只有首次调用会启动netsh进程；
+    配合prefetch_network_admin_capability在启动时后台预探测，主线程不会阻塞在netsh上。
+    
+    Returns:
+        bool: True表示具有网络配置权限，False表示权限不足
+    """
+    global _network_admin_capability
+    
+    if _network_admin_capability is None:
+        with _network_admin_capability_lock:
+            # 双重检查，避免后台预探测与主线程同时启动netsh
+            if _network_admin_capability is None:
+                _network_admin_capability = _probe_network_admin_capability()
+    
+    return _network_admin_capability
+
+
+def prefetch_network_admin_capability() -> threading.Thread:
+    """
+    在后台线程中预先探测网络管理能力
+    
+    应用启动时调用，让耗时的netsh探测与UI初始化并行进行，
+    之后对check_network_admin_capability的调用直接返回缓存结果。
+    
+    Returns:
+        threading.Thread: 执行探测的后台线程
+    """
+    thread = threading.Thread(
+        target=check_network_admin_capability,
+        name="NetworkAdminCapabilityProbe",
+        daemon=True
+    )
+    thread.start()
+    return thread
+
+
+def _probe_network_admin_capability() -> bool:
+    """
+    执行netsh查询命令实际探测网络配置权限
+    
     Returns:
         bool: True表示具有网络配置权限，False表示权限不足
     """
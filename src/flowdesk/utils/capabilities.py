@@ -29,7 +29,13 @@ import os
 import sys
 import platform
 import ctypes
-from typing import Dict, Any, Optional
+import functools
+import importlib.util
+import shutil
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from types import MappingProxyType
+from typing import Any, Mapping, Optional
 import logging
 
 # 获取日志记录器
@@ -40,7 +46,32 @@ from ..models import (
 )
 logger = get_logger(__name__)
 
+# 操作系统在进程生命周期内不变，导入时确定一次，避免各检测函数重复调用platform.system()
+_SYSTEM = platform.system()
+_IS_WINDOWS = _SYSTEM == "Windows"
 
+# 管理员权限检测API在导入时解析一次并声明原型，避免每次调用经过windll的属性查找；
+# 使用独立的WinDLL实例，不修改ctypes.windll上与其他模块共享的函数对象
+if _IS_WINDOWS:
+    _IsUserAnAdmin = ctypes.WinDLL('shell32').IsUserAnAdmin
+    _IsUserAnAdmin.restype = ctypes.c_int
+    _IsUserAnAdmin.argtypes = []
+else:
+    _IsUserAnAdmin = None
+
+# LibreHardwareMonitor DLL路径在进程生命周期内不变，导入时计算一次
+# 当前文件路径: src/flowdesk/utils/capabilities.py，项目根目录为向上3级目录
+_HW_DLL = (Path(__file__).resolve().parents[3]
+           / 'assets' / 'LibreHardwareMonitor' / 'LibreHardwareMonitorLib.dll')
+
+# 系统能力报告缓存（SystemCapabilities为冻结数据类，其中的PyQt信息为只读映射，可安全共享给所有调用方）
+_capabilities_cache: Optional[SystemCapabilities] = None
+
+# 需要检测可用性的网络诊断工具，名称与NetworkCapabilities字段一一对应
+NETWORK_TOOL_COMMANDS = ('ping', 'tracert', 'netstat', 'ipconfig', 'nslookup')
+
+
+@functools.lru_cache(maxsize=1)
 def check_admin_privileges() -> bool:
     """
     检测当前程序是否以管理员权限运行
@@ -60,13 +91,18 @@ def check_admin_privileges() -> bool:
             print("✅ 当前具有管理员权限，可以修改网络配置")
         else:
             print("⚠️ 当前为普通用户权限，部分功能可能受限")
+    
+    缓存说明：
+    进程的权限在运行期间不会变化，检测结果会被缓存，
+    后续调用不再跨越ctypes调用Windows API。权限提升流程可调用
+    invalidate_admin_cache() 强制重新检测。
     """
     try:
         # Windows系统权限检测
-        if platform.system() == "Windows":
+        if _IsUserAnAdmin is not None:
             # 使用Windows API检测管理员权限
-            # ctypes.windll.shell32.IsUserAnAdmin() 返回非零值表示管理员权限
-            return ctypes.windll.shell32.IsUserAnAdmin() != 0
+            # shell32.IsUserAnAdmin() 返回非零值表示管理员权限
+            return _IsUserAnAdmin() != 0
         else:
             # 非Windows系统（Linux/macOS）权限检测
             # 检测有效用户ID是否为0（root用户）
@@ -78,7 +114,28 @@ def check_admin_privileges() -> bool:
         return False
 
 
-def get_system_capabilities() -> Dict[str, Any]:
+def invalidate_admin_cache() -> None:
+    """
+    清除管理员权限检测缓存
+    
+    在UAC权限提升等会改变进程权限的流程之后调用，
+    下一次check_admin_privileges()将重新检测权限状态。
+    """
+    check_admin_privileges.cache_clear()
+    invalidate_capabilities_cache()
+
+
+def invalidate_capabilities_cache() -> None:
+    """
+    清除系统能力报告缓存
+    
+    下一次get_system_capabilities()将重新汇总各项检测结果。
+    """
+    global _capabilities_cache
+    _capabilities_cache = None
+
+
+def get_system_capabilities() -> SystemCapabilities:
     """
     获取系统能力和环境信息的综合报告
     
@@ -105,41 +162,37 @@ def get_system_capabilities() -> Dict[str, Any]:
         print(f"管理员权限: {'是' if caps['admin_privileges'] else '否'}")
         if caps['windows_version']['major'] < 10:
             print("⚠️ 建议升级到Windows 10以获得最佳体验")
+    
+    缓存说明：
+    系统能力在进程运行期间不会变化，首次检测成功后返回同一个不可变的
+    SystemCapabilities实例。可调用 invalidate_capabilities_cache() 强制重新检测。
     """
+    global _capabilities_cache
+    if _capabilities_cache is not None:
+        return _capabilities_cache
+    
     try:
-        # 创建平台信息数据类
-        platform_info = PlatformInfo(
-            system=platform.system(),
-            release=platform.release(),
-            version=platform.version(),
-            machine=platform.machine(),
-            processor=platform.processor()
-        )
-        
-        # 创建Python版本信息数据类
-        python_version_info = PythonVersionInfo(
-            major=sys.version_info.major,
-            minor=sys.version_info.minor,
-            micro=sys.version_info.micro,
-            full=sys.version
-        )
-        
-        # 权限状态检测
-        admin_privileges = check_admin_privileges()
-        
-        # Windows特定信息
-        windows_version_info = None
-        if platform.system() == "Windows":
-            windows_version_info = _get_windows_version()
-        
-        # PyQt5可用性检测
-        pyqt_available = _check_pyqt_availability()
-        
-        # 网络工具可用性检测
-        network_tools = _check_network_tools()
-        
-        # 硬件监控可用性检测
-        hardware_monitor = _check_hardware_monitor()
+        # 各项检测相互独立且主要耗时在注册表/文件系统/模块查找等I/O上，
+        # 提交到线程池并发执行，总耗时取决于最慢的一项检测
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            windows_version_future = (executor.submit(_get_windows_version)
+                                      if _IS_WINDOWS else None)
+            pyqt_future = executor.submit(_check_pyqt_availability)
+            network_tools_future = executor.submit(_check_network_tools)
+            hardware_monitor_future = executor.submit(_check_hardware_monitor)
+            
+            # 主线程在等待期间完成其余轻量检测
+            platform_info, python_version_info, admin_privileges = _collect_basic_info()
+            
+            # Windows特定信息
+            windows_version_info = (windows_version_future.result()
+                                    if windows_version_future else None)
+            # PyQt5可用性检测
+            pyqt_available = pyqt_future.result()
+            # 网络工具可用性检测
+            network_tools = network_tools_future.result()
+            # 硬件监控可用性检测
+            hardware_monitor = hardware_monitor_future.result()
         
         # 创建系统能力数据类
         capabilities = SystemCapabilities(
@@ -153,6 +206,7 @@ def get_system_capabilities() -> Dict[str, Any]:
         )
         
         logger.info("系统能力检测完成")
+        _capabilities_cache = capabilities
         return capabilities
         
     except Exception as e:
@@ -160,7 +214,7 @@ def get_system_capabilities() -> Dict[str, Any]:
         # 返回最小可用的能力信息
         return SystemCapabilities(
             platform=PlatformInfo(
-                system=platform.system(),
+                system=_SYSTEM,
                 release='unknown',
                 version='unknown', 
                 machine='unknown',
@@ -179,6 +233,39 @@ def get_system_capabilities() -> Dict[str, Any]:
         )
 
 
+def _collect_basic_info() -> tuple:
+    """
+    收集平台信息、Python版本和管理员权限状态
+    
+    内部函数，这些检测耗时很短，在主线程中与其他并发检测同时完成。
+    
+    返回值：
+        tuple: (PlatformInfo, PythonVersionInfo, bool)
+    """
+    # 创建平台信息数据类
+    platform_info = PlatformInfo(
+        system=_SYSTEM,
+        release=platform.release(),
+        version=platform.version(),
+        machine=platform.machine(),
+        processor=platform.processor()
+    )
+    
+    # 创建Python版本信息数据类
+    python_version_info = PythonVersionInfo(
+        major=sys.version_info.major,
+        minor=sys.version_info.minor,
+        micro=sys.version_info.micro,
+        full=sys.version
+    )
+    
+    # 权限状态检测
+    admin_privileges = check_admin_privileges()
+    
+    return platform_info, python_version_info, admin_privileges
+
+
+@functools.lru_cache(maxsize=1)
 def _get_windows_version() -> WindowsVersionInfo:
     """
     获取详细的Windows版本信息
@@ -195,39 +282,31 @@ def _get_windows_version() -> WindowsVersionInfo:
     try:
         import winreg
         
-        # 从注册表读取Windows版本信息
-        key = winreg.OpenKey(winreg.HKEY_LOCAL_MACHINE, 
-                           r"SOFTWARE\Microsoft\Windows NT\CurrentVersion")
-        
-        major = None
-        minor = None
-        build = None
-        display_version = None
+        # 从注册表读取Windows版本信息，with块保证异常时注册表句柄也能关闭
+        with winreg.OpenKey(winreg.HKEY_LOCAL_MACHINE, 
+                            r"SOFTWARE\Microsoft\Windows NT\CurrentVersion") as key:
+            # 一次性枚举该键下的全部值，避免逐项QueryValueEx的多次注册表往返
+            value_count = winreg.QueryInfoKey(key)[1]
+            values = {}
+            for index in range(value_count):
+                name, data, _ = winreg.EnumValue(key, index)
+                values[name] = data
         
-        try:
-            # 读取主要版本号
-            major = winreg.QueryValueEx(key, "CurrentMajorVersionNumber")[0]
-            minor = winreg.QueryValueEx(key, "CurrentMinorVersionNumber")[0]
-        except FileNotFoundError:
+        # 读取主要版本号
+        major = values.get("CurrentMajorVersionNumber")
+        minor = values.get("CurrentMinorVersionNumber")
+        if major is None or minor is None:
             # Windows 7及更早版本使用不同的注册表项
-            version = winreg.QueryValueEx(key, "CurrentVersion")[0]
+            version = values.get("CurrentVersion", "")
             version_parts = version.split('.')
             major = int(version_parts[0])
             minor = int(version_parts[1]) if len(version_parts) > 1 else 0
         
         # 读取构建号
-        try:
-            build = winreg.QueryValueEx(key, "CurrentBuildNumber")[0]
-        except FileNotFoundError:
-            build = "未知"
+        build = values.get("CurrentBuildNumber", "未知")
         
         # 读取产品名称作为显示版本
-        try:
-            display_version = winreg.QueryValueEx(key, "ProductName")[0]
-        except FileNotFoundError:
-            display_version = "Windows"
-        
-        winreg.CloseKey(key)
+        display_version = values.get("ProductName", "Windows")
         
         # 创建Windows版本信息数据类
         return WindowsVersionInfo(
@@ -247,7 +326,8 @@ def _get_windows_version() -> WindowsVersionInfo:
         )
 
 
-def _check_pyqt_availability() -> Dict[str, Any]:
+@functools.lru_cache(maxsize=1)
+def _check_pyqt_availability() -> Mapping[str, Any]:
     """
     检测PyQt5的可用性和版本信息
     
@@ -257,51 +337,58 @@ def _check_pyqt_availability() -> Dict[str, Any]:
     2. 显示PyQt版本信息
     3. 检测特定功能的支持情况
     
+    结果被缓存并放入所有系统能力报告中，因此以只读映射返回，
+    防止某个调用方修改后影响其他调用方。
+    
     返回值：
-        Dict[str, Any]: PyQt5可用性信息
+        Mapping[str, Any]: PyQt5可用性信息（只读）
     """
     try:
         import PyQt5.QtCore
         import PyQt5.QtWidgets
         import PyQt5.QtGui
         
-        return {
+        return MappingProxyType({
             'available': True,
             'version': PyQt5.QtCore.QT_VERSION_STR,
             'pyqt_version': PyQt5.QtCore.PYQT_VERSION_STR,
-            'modules': {
+            'modules': MappingProxyType({
                 'QtCore': True,
                 'QtWidgets': True,
                 'QtGui': True,
                 'QtNetwork': _check_module('PyQt5.QtNetwork'),
                 'QtSystemTrayIcon': _check_system_tray()
-            }
-        }
+            })
+        })
         
     except ImportError as e:
         logger.error(f"PyQt5不可用: {e}")
-        return {
+        return MappingProxyType({
             'available': False,
             'error': str(e),
-            'modules': {}
-        }
+            'modules': MappingProxyType({})
+        })
 
 
 def _check_module(module_name: str) -> bool:
-    """检测指定模块是否可用"""
+    """
+    检测指定模块是否可用
+    
+    只通过find_spec查找模块而不真正导入，避免为了可用性检测
+    加载QtNetwork等较重的扩展模块，推迟到真正使用时再导入。
+    """
     try:
-        __import__(module_name)
-        return True
-    except ImportError:
+        return importlib.util.find_spec(module_name) is not None
+    except (ImportError, ValueError):
         return False
 
 
+@functools.lru_cache(maxsize=1)
 def _check_system_tray() -> bool:
-    """检测系统托盘功能是否可用"""
+    """检测系统托盘功能是否可用（结果在进程生命周期内不变，缓存首次检测结果）"""
     try:
         # 移除PyQt依赖，基于系统平台判断
-        import platform
-        system = platform.system().lower()
+        system = _SYSTEM.lower()
         
         # Windows和Linux通常支持系统托盘，macOS需要特殊处理
         if system in ['windows', 'linux']:
@@ -315,6 +402,7 @@ def _check_system_tray() -> bool:
         return False
 
 
+@functools.lru_cache(maxsize=1)
 def _check_network_tools() -> NetworkCapabilities:
     """
     检测网络工具的可用性
@@ -325,22 +413,22 @@ def _check_network_tools() -> NetworkCapabilities:
     返回值：
         Dict[str, bool]: 网络工具可用性状态
     """
-    # 检测各种网络工具的可用性
-    ping_available = _check_command_availability('ping')
-    tracert_available = _check_command_availability('tracert')
-    netstat_available = _check_command_availability('netstat')
-    ipconfig_available = _check_command_availability('ipconfig')
-    nslookup_available = _check_command_availability('nslookup')
-    
-    return NetworkCapabilities(
-        ping=ping_available,
-        tracert=tracert_available,
-        netstat=netstat_available,
-        ipconfig=ipconfig_available,
-        nslookup=nslookup_available
-    )
+    tools = {command: _check_command_availability(command) for command in NETWORK_TOOL_COMMANDS}
+    
+    return NetworkCapabilities(**tools)
+
+
+@functools.lru_cache(maxsize=1)
+def _libre_hw_available() -> bool:
+    """
+    检测LibreHardwareMonitor DLL文件是否存在
+    
+    首次调用时访问一次文件系统，结果缓存，避免导入模块时即产生磁盘访问。
+    """
+    return _HW_DLL.is_file()
 
 
+@functools.lru_cache(maxsize=1)
 def _check_hardware_monitor() -> HardwareMonitorCapabilities:
     """
     检测硬件监控功能的可用性
@@ -351,15 +439,10 @@ def _check_hardware_monitor() -> HardwareMonitorCapabilities:
     返回值：
         Dict[str, Any]: 硬件监控可用性信息
     """
-    # 检测LibreHardwareMonitor DLL文件
-    dll_path = os.path.join(os.path.dirname(__file__), 
-                           '..', '..', '..', 'assets', 'LibreHardwareMonitor')
-    
-    dll_available = os.path.exists(os.path.join(dll_path, 'LibreHardwareMonitorLib.dll'))
-    
+    # 检测LibreHardwareMonitor DLL文件（路径在模块导入时确定，存在性首次检测后缓存）
     return HardwareMonitorCapabilities(
-        dll_path=dll_path,
-        available=dll_available
+        dll_path=str(_HW_DLL.parent),
+        available=_libre_hw_available()
     )
 
 
@@ -373,25 +456,9 @@ def _check_command_availability(command: str) -> bool:
     返回值：
         bool: 命令是否可用
     """
-    try:
-        import subprocess
-        
-        # 使用where命令（Windows）或which命令（Unix）检测命令是否存在
-        if platform.system() == "Windows":
-            result = subprocess.run(['where', command], 
-                                  capture_output=True, 
-                                  text=True, 
-                                  timeout=5)
-        else:
-            result = subprocess.run(['which', command], 
-                                  capture_output=True, 
-                                  text=True, 
-                                  timeout=5)
-        
-        return result.returncode == 0
-        
-    except Exception:
-        return False
+    # shutil.which直接在PATH中查找（Windows下会按PATHEXT匹配.exe等扩展名），
+    # 与where/which结果一致，但不需要启动子进程
+    return shutil.which(command) is not None
 
 
 # 模块使用示例和测试代码
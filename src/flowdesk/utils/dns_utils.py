@@ -3,7 +3,8 @@
 DNS工具函数｜专门负责DNS服务器相关的验证和推荐功能
 """
 import logging
-from typing import Dict, List
+import types
+from typing import Mapping, Tuple
 from .ip_validation_utils import validate_ip_address
 
 # 获取日志记录器
@@ -33,24 +34,26 @@ def validate_dns_server(dns: str) -> bool:
 
 
 # 常用的DNS服务器地址
-COMMON_DNS_SERVERS = {
-    "Google DNS": ["8.8.8.8", "8.8.4.4"],
-    "Cloudflare DNS": ["1.1.1.1", "1.0.0.1"],
-    "阿里DNS": ["223.5.5.5", "223.6.6.6"],
-    "腾讯DNS": ["119.29.29.29", "182.254.116.116"],
-    "百度DNS": ["180.76.76.76"],
-    "114DNS": ["114.114.114.114", "114.114.115.115"]
-}
+# 使用只读映射和元组保存，调用方无法修改共享数据，获取时也无需复制
+COMMON_DNS_SERVERS = types.MappingProxyType({
+    "Google DNS": ("8.8.8.8", "8.8.4.4"),
+    "Cloudflare DNS": ("1.1.1.1", "1.0.0.1"),
+    "阿里DNS": ("223.5.5.5", "223.6.6.6"),
+    "腾讯DNS": ("119.29.29.29", "182.254.116.116"),
+    "百度DNS": ("180.76.76.76",),
+    "114DNS": ("114.114.114.114", "114.114.115.115")
+})
 
 
-def get_recommended_dns_servers() -> Dict[str, List[str]]:
+def get_recommended_dns_servers() -> Mapping[str, Tuple[str, ...]]:
     """
     获取推荐的DNS服务器列表
     
     返回值：
-        Dict[str, List[str]]: DNS服务器提供商及其地址列表
+        Mapping[str, Tuple[str, ...]]: DNS服务器提供商及其地址列表（只读）
+        如需修改，请使用 dict(get_recommended_dns_servers()) 创建副本
     """
-    return COMMON_DNS_SERVERS.copy()
+    return COMMON_DNS_SERVERS
 
 
 # 模块测试代码
@@ -5,12 +5,51 @@ IP地址验证工具｜专门负责IP地址、子网掩码、MAC地址等网络
 import re
 import ipaddress
 import logging
-from typing import Union
+import functools
+from typing import Iterable, List, Optional, Union
 
 # 获取日志记录器
 logger = logging.getLogger(__name__)
 
+# 预编译的正则表达式，避免每次调用都经过re模块的缓存查找
+# MAC地址：支持 AA:BB:CC:DD:EE:FF 和 AA-BB-CC-DD-EE-FF 格式
+_MAC_RE = re.compile(r'^([0-9A-Fa-f]{2}[:-]){5}([0-9A-Fa-f]{2})$')
+# MAC地址分隔符删除表，str.translate按字符删除，无需经过正则引擎
+_MAC_STRIP = str.maketrans('', '', ':-')
 
+# CIDR前缀长度与点分十进制子网掩码的对照表，只有33种取值，导入时预先计算
+# 例如：_CIDR_TO_MASK[24] == "255.255.255.0"，_MASK_TO_CIDR["255.255.255.0"] == 24
+_CIDR_TO_MASK = tuple(
+    str(ipaddress.IPv4Network(f"0.0.0.0/{cidr}", strict=False).netmask)
+    for cidr in range(33)
+)
+_MASK_TO_CIDR = {mask: cidr for cidr, mask in enumerate(_CIDR_TO_MASK)}
+# 所有规范写法的有效子网掩码：33个点分十进制掩码加上 /0 到 /32
+_VALID_MASK_STRS = frozenset(_CIDR_TO_MASK) | frozenset(f"/{cidr}" for cidr in range(33))
+
+
+def _memoize_validator(func):
+    """
+    为纯验证函数添加LRU缓存
+    
+    验证函数的结果只取决于输入值，而UI刷新时会对同一批IP、掩码反复验证，
+    缓存后重复验证只是一次字典查找。只有字符串和整数参数会进入缓存，
+    其他类型（None、列表等）绕过缓存直接调用原函数，保持原有的容错行为。
+    """
+    cached = functools.lru_cache(maxsize=256, typed=True)(func)
+    
+    @functools.wraps(func)
+    def wrapper(value):
+        if isinstance(value, (str, int)):
+            return cached(value)
+        return func(value)
+    
+    wrapper.cache_info = cached.cache_info
+    wrapper.cache_clear = cached.cache_clear
+    return wrapper
+
+
+@_memoize_validator
 def validate_ip_address(ip: str) -> bool:
     """
     验证IP地址格式是否正确
@@ -41,15 +80,54 @@ def validate_ip_address(ip: str) -> bool:
     if not ip or not isinstance(ip, str):
         return False
     
+    ip = ip.strip()
+    
+    # 快速路径：不含冒号的输入只可能是IPv4，直接逐段检查
+    # 规则与ipaddress一致：4段ASCII数字，每段最多3位、不超过255、不允许前导零
+    # 长度不在7-15之间（0.0.0.0 到 255.255.255.255）的直接拒绝，不必再拆分
+    if ':' not in ip:
+        parts = ip.split('.') if 7 <= len(ip) <= 15 else ()
+        if len(parts) == 4 and ip.isascii() and all(
+            part.isdigit() and len(part) <= 3 and int(part) <= 255
+            and (part == '0' or part[0] != '0')
+            for part in parts
+        ):
+            return True
+        logger.debug(f"无效的IP地址格式: {ip}")
+        return False
+    
     try:
-        # 使用Python标准库验证IP地址
-        ipaddress.ip_address(ip.strip())
+        # IPv6地址使用Python标准库验证
+        ipaddress.ip_address(ip)
         return True
     except ValueError:
         logger.debug(f"无效的IP地址格式: {ip}")
         return False
 
 
+def validate_ip_addresses(ips: Iterable[str]) -> List[bool]:
+    """
+    批量验证IP地址格式
+    
+    作用说明：
+    用于一次验证多个IP地址（如粘贴的IP列表、DNS服务器列表），
+    结果与逐个调用validate_ip_address一致，但省去调用方循环中的重复名称查找。
+    
+    参数说明：
+        ips (Iterable[str]): 要验证的IP地址序列
+        
+    返回值：
+        List[bool]: 与输入一一对应的验证结果
+        
+    使用示例：
+        results = validate_ip_addresses(["192.168.1.1", "256.0.0.1"])
+        print(results)  # 输出: [True, False]
+    """
+    validate = validate_ip_address
+    return [validate(ip) for ip in ips]
+
+
+@_memoize_validator
 def validate_subnet_mask(mask: str) -> bool:
     """
     验证子网掩码格式是否正确
@@ -80,21 +158,18 @@ def validate_subnet_mask(mask: str) -> bool:
     
     mask = mask.strip()
     
+    # 规范写法直接查表命中，绝大多数输入在此返回
+    if mask in _VALID_MASK_STRS:
+        return True
+    
     try:
-        # 检查CIDR格式 (如 /24)
+        # 检查CIDR格式 (如 /24)，兼容 /08 这类int()可接受的非规范写法
         if mask.startswith('/'):
             cidr = int(mask[1:])
             return 0 <= cidr <= 32
         
-        # 检查点分十进制格式 (如 255.255.255.0)
-        if validate_ip_address(mask):
-            # 验证是否为有效的子网掩码
-            mask_int = int(ipaddress.IPv4Address(mask))
-            # 子网掩码必须是连续的1后跟连续的0
-            # 例如：11111111.11111111.11111111.00000000 (255.255.255.0)
-            binary = bin(mask_int)[2:].zfill(32)
-            return re.match(r'^1*0*$', binary) is not None
-        
+        # 点分十进制格式：validate_ip_address不接受前导零，
+        # 有效掩码只有表中33种写法，未命中即无效
         return False
         
     except (ValueError, ipaddress.AddressValueError):
@@ -102,6 +177,7 @@ def validate_subnet_mask(mask: str) -> bool:
         return False
 
 
+@_memoize_validator
 def validate_mac_address(mac: str) -> bool:
     """
     验证MAC地址格式是否正确
@@ -125,11 +201,26 @@ def validate_mac_address(mac: str) -> bool:
     if not mac or not isinstance(mac, str):
         return False
     
-    # MAC地址的正则表达式模式
-    # 支持 AA:BB:CC:DD:EE:FF 和 AA-BB-CC-DD-EE-FF 格式
-    mac_pattern = r'^([0-9A-Fa-f]{2}[:-]){5}([0-9A-Fa-f]{2})$'
+    mac = mac.strip()
+    # 有效MAC地址固定为17个字符，长度不符的输入无需经过正则引擎
+    if len(mac) != 17:
+        return False
     
-    return bool(re.match(mac_pattern, mac.strip()))
+    return bool(_MAC_RE.match(mac))
+
+
+def validate_mac_addresses(macs: Iterable[str]) -> List[bool]:
+    """
+    批量验证MAC地址格式
+    
+    参数说明：
+        macs (Iterable[str]): 要验证的MAC地址序列
+        
+    返回值：
+        List[bool]: 与输入一一对应的验证结果，非字符串元素视为无效
+    """
+    match = _MAC_RE.match
+    return [isinstance(mac, str) and bool(match(mac.strip())) for mac in macs]
 
 
 def cidr_to_subnet_mask(cidr: int) -> str:
@@ -157,13 +248,8 @@ def cidr_to_subnet_mask(cidr: int) -> str:
         logger.warning(f"无效的CIDR值: {cidr}")
         return ""
     
-    try:
-        # 创建网络对象并获取子网掩码
-        network = ipaddress.IPv4Network(f"0.0.0.0/{cidr}", strict=False)
-        return str(network.netmask)
-    except ValueError as e:
-        logger.error(f"CIDR转换失败: {e}")
-        return ""
+    # 直接查表，无需构造网络对象
+    return _CIDR_TO_MASK[cidr]
 
 
 def subnet_mask_to_cidr(mask: str) -> int:
@@ -186,6 +272,12 @@ def subnet_mask_to_cidr(mask: str) -> int:
         cidr = subnet_mask_to_cidr("255.255.0.0")
         print(f"子网掩码 255.255.0.0 对应的CIDR: /{cidr}")  # 输出: /16
     """
+    # 常见情况：标准的点分十进制子网掩码，直接查表
+    if isinstance(mask, str):
+        cidr = _MASK_TO_CIDR.get(mask.strip())
+        if cidr is not None:
+            return cidr
+    
     if not validate_subnet_mask(mask):
         logger.warning(f"无效的子网掩码: {mask}")
         return -1
@@ -193,13 +285,14 @@ def subnet_mask_to_cidr(mask: str) -> int:
     try:
         # 将子网掩码转换为整数，然后计算前缀长度
         mask_int = int(ipaddress.IPv4Address(mask))
-        # 计算二进制中1的个数
-        return bin(mask_int).count('1')
+        # 掩码已确认连续，前缀长度等于32减去取反后主机位的位数
+        return 32 - ((~mask_int) & 0xFFFFFFFF).bit_length()
     except ValueError as e:
         logger.error(f"子网掩码转换失败: {e}")
         return -1
 
 
+@_memoize_validator
 def is_private_ip(ip: str) -> bool:
     """
     判断IP地址是否为私有地址
@@ -220,16 +313,17 @@ def is_private_ip(ip: str) -> bool:
         else:
             print("这是公网IP地址")
     """
-    if not validate_ip_address(ip):
+    if not ip or not isinstance(ip, str):
         return False
     
+    # 直接构造IPv4Address，一次解析同时完成格式验证，无需先调用validate_ip_address
     try:
-        ip_obj = ipaddress.IPv4Address(ip)
-        return ip_obj.is_private
+        return ipaddress.IPv4Address(ip).is_private
     except ValueError:
         return False
 
 
+@_memoize_validator
 def is_valid_port(port: Union[str, int]) -> bool:
     """
     验证端口号是否有效
@@ -249,6 +343,14 @@ def is_valid_port(port: Union[str, int]) -> bool:
         else:
             print("❌ 端口号无效")
     """
+    # 常见输入（整数或纯数字字符串）直接做范围判断，不经过异常处理
+    if isinstance(port, int):
+        return 1 <= port <= 65535
+    if isinstance(port, str):
+        digits = port.strip()
+        if digits.isdecimal():
+            return 1 <= int(digits) <= 65535
+    
     try:
         port_int = int(port)
         return 1 <= port_int <= 65535
@@ -256,6 +358,7 @@ def is_valid_port(port: Union[str, int]) -> bool:
         return False
 
 
+@_memoize_validator
 def smart_validate_subnet_mask(mask: str) -> bool:
     """
     智能验证子网掩码格式，支持多种输入格式
@@ -288,20 +391,7 @@ def smart_validate_subnet_mask(mask: str) -> bool:
     if not mask or not isinstance(mask, str):
         return False
     
-    mask = mask.strip()
-    
-    try:
-        # 检查纯数字格式 (如 24)
-        if mask.isdigit():
-            cidr = int(mask)
-            return 1 <= cidr <= 32
-        
-        # 使用原有的验证逻辑处理CIDR和点分十进制格式
-        return validate_subnet_mask(mask)
-        
-    except (ValueError, TypeError):
-        logger.debug(f"智能子网掩码验证失败: {mask}")
-        return False
+    return _parse_mask(mask) is not None
 
 
 def normalize_subnet_mask_for_netsh(mask: str) -> str:
@@ -336,41 +426,49 @@ def normalize_subnet_mask_for_netsh(mask: str) -> str:
         return mask
     
     mask = mask.strip()
+    # /0 不转换为0.0.0.0交给netsh，与纯数字格式一样只接受1-32，无效时原样返回
+    normalized = _parse_mask(mask, allow_zero_prefix=False)
+    if normalized is None:
+        logger.warning(f"无效的子网掩码: {mask}")
+        return mask
     
-    try:
-        # 处理纯数字格式 (如 24)
-        if mask.isdigit():
-            cidr = int(mask)
-            if 1 <= cidr <= 32:
-                converted = cidr_to_subnet_mask(cidr)
-                logger.debug(f"纯数字CIDR转换: {mask} -> {converted}")
-                return converted
-            else:
-                logger.warning(f"无效的CIDR值: {mask}")
-                return mask
+    logger.debug(f"子网掩码标准化: {mask} -> {normalized}")
+    return normalized
+
+
+def _parse_mask(mask: str, allow_zero_prefix: bool = True) -> Optional[str]:
+    """
+    一次解析子网掩码输入，返回标准的点分十进制格式
+    
+    支持三种输入格式：
+    1. 纯数字格式：1-32
+    2. CIDR格式：/0 到 /32（allow_zero_prefix为False时为 /1 到 /32）
+    3. 点分十进制格式：必须是33个合法子网掩码之一
+    
+    参数说明：
+        mask (str): 子网掩码字符串
+        allow_zero_prefix (bool): 是否接受 /0 前缀
         
-        # 处理CIDR格式 (如 /24)
-        if mask.startswith('/'):
+    返回值：
+        Optional[str]: 点分十进制格式的子网掩码，输入无效时返回None
+    """
+    mask = mask.strip()
+    
+    # isdecimal而非isdigit：'²'这类字符isdigit为True，但int()无法转换
+    if mask.isdecimal():
+        cidr = int(mask)
+        return _CIDR_TO_MASK[cidr] if 1 <= cidr <= 32 else None
+    
+    if mask.startswith('/'):
+        try:
             cidr = int(mask[1:])
-            if 1 <= cidr <= 32:
-                converted = cidr_to_subnet_mask(cidr)
-                logger.debug(f"CIDR格式转换: {mask} -> {converted}")
-                return converted
-            else:
-                logger.warning(f"无效的CIDR值: {mask}")
-                return mask
-        
-        # 已经是点分十进制格式，验证后直接返回
-        if validate_subnet_mask(mask):
-            logger.debug(f"点分十进制格式保持不变: {mask}")
-            return mask
-        else:
-            logger.warning(f"无效的点分十进制子网掩码: {mask}")
-            return mask
-            
-    except (ValueError, TypeError) as e:
-        logger.error(f"子网掩码标准化失败: {mask}, 错误: {e}")
-        return mask
+        except ValueError:
+            return None
+        min_cidr = 0 if allow_zero_prefix else 1
+        return _CIDR_TO_MASK[cidr] if min_cidr <= cidr <= 32 else None
+    
+    # 合法的点分十进制子网掩码恰好是对照表中的33个标准字符串
+    return mask if mask in _MASK_TO_CIDR else None
 
 
 def format_mac_address(mac: str, separator: str = ":") -> str:
@@ -395,8 +493,12 @@ def format_mac_address(mac: str, separator: str = ":") -> str:
         return mac
     
     try:
-        # 移除所有分隔符并转换为大写
-        clean_mac = re.sub(r'[:-]', '', mac.upper())
+        # 移除首尾空白和所有分隔符并转换为大写
+        clean_mac = mac.strip().upper().translate(_MAC_STRIP)
+        # 单个ASCII非字母分隔符（常见的":"、"-"）由bytes.hex在C层直接插入，
+        # bytes.hex只接受ASCII分隔符，"："等全角字符走下面的join路径
+        if len(separator) == 1 and separator.isascii() and not separator.isalpha():
+            return bytes.fromhex(clean_mac).hex(separator).upper()
         # 重新添加分隔符
         formatted = separator.join([clean_mac[i:i+2] for i in range(0, 12, 2)])
         return formatted
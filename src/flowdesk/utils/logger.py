@@ -20,22 +20,81 @@
     logger.error("发生错误", exc_info=True)
 """
 
+import atexit
+import functools
+import json
 import logging
 import logging.handlers
 import os
+import queue
 import sys
-from datetime import datetime
+import threading
+import time
 from pathlib import Path
 
 from .resource_path import get_log_path
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 
 # 全局日志配置
 _logger_initialized = False
-_loggers = {}
+_init_lock = threading.Lock()
+# 日志时间格式
+_LOG_DATE_FORMAT = "%Y-%m-%d %H:%M:%S"
+# 文件日志后台写入监听器：调用方只负责入队，由监听线程完成磁盘写入
+_file_log_listener = None
 
 
-def setup_logging(log_level=logging.INFO, enable_file_logging=True, enable_console_logging=True, verbose_mode=False):
+class _BatchedFileHandler(logging.FileHandler):
+    """
+    批量刷新的文件日志处理器
+    
+    标准FileHandler每写入一条记录就flush一次，产生一次write系统调用。
+    该处理器写入后只留在文件缓冲区中，由_BatchingQueueListener在队列空闲
+    或遇到ERROR级别记录时统一刷新，使连续的日志合并为少量磁盘写入。
+    关闭处理器时文件流会自动刷新剩余内容。
+    """
+    
+    def flush(self):
+        # 逐条写入后不立即刷新，由flush_buffer统一完成
+        pass
+    
+    def flush_buffer(self):
+        """将缓冲区中的日志写入磁盘"""
+        super().flush()
+
+
+class _BatchingQueueListener(logging.handlers.QueueListener):
+    """
+    日志队列监听器
+    
+    在队列中暂无待处理记录时刷新文件缓冲区；ERROR及以上级别的记录立即刷新，
+    保证错误信息尽快落盘。
+    """
+    
+    def dequeue(self, block):
+        if block and self.queue.empty():
+            self._flush_handlers()
+        return self.queue.get(block)
+    
+    def handle(self, record):
+        super().handle(record)
+        if record.levelno >= logging.ERROR:
+            self._flush_handlers()
+    
+    def _flush_handlers(self):
+        for handler in self.handlers:
+            flush_buffer = getattr(handler, 'flush_buffer', None)
+            if flush_buffer is not None:
+                flush_buffer()
+
+
+def setup_logging(log_level=logging.INFO, enable_file_logging=True, enable_console_logging=True, verbose_mode=False,
+                  json_file_logging=False):
     """
     设置应用程序的分级日志系统
     
@@ -54,51 +113,70 @@ def setup_logging(log_level=logging.INFO, enable_file_logging=True, enable_conso
         enable_file_logging (bool): 是否启用文件日志记录，生产环境建议开启
         enable_console_logging (bool): 是否启用控制台日志显示，调试时建议开启
         verbose_mode (bool): 是否启用详细模式，True时控制台也显示DEBUG信息
+        json_file_logging (bool): 是否以JSON行格式写入文件日志，便于日志分析工具处理
     """
-    global _logger_initialized
+    global _logger_initialized, _file_log_listener
     
+    # 双重检查：未加锁的快速判断覆盖已初始化的常见情况，
+    # 加锁后再次判断，避免多个线程同时初始化导致重复安装处理器
     if _logger_initialized:
         return
     
-    # 设置根日志记录器的最低级别为DEBUG，确保所有级别的日志都能被处理
-    # 具体的过滤由各个handler的级别设置来控制
-    root_logger = logging.getLogger()
-    root_logger.setLevel(logging.DEBUG)  # 根记录器设为最低级别，由handler控制过滤
-    
-    # 清除可能存在的旧处理器，确保配置的纯净性
-    root_logger.handlers.clear()
-    
-    # 创建统一的日志消息格式器，包含时间戳、模块名、级别等关键信息
-    formatter = create_log_formatter()
-    
-    # 配置控制台日志处理器：根据verbose模式动态调整显示级别
-    if enable_console_logging:
-        console_handler = create_console_handler(formatter, verbose_mode)
-        root_logger.addHandler(console_handler)
-    
-    # 配置文件日志处理器：始终记录详细的DEBUG级别信息
-    if enable_file_logging:
-        file_handler = create_file_handler(formatter)
-        if file_handler:
-            root_logger.addHandler(file_handler)
-    
-    # 配置第三方库的日志级别，避免过多的第三方调试信息干扰
-    configure_third_party_loggers()
-    
-    _logger_initialized = True
+    with _init_lock:
+        if _logger_initialized:
+            return
+        
+        # 设置根日志记录器的最低级别为DEBUG，确保所有级别的日志都能被处理
+        # 具体的过滤由各个handler的级别设置来控制
+        root_logger = logging.getLogger()
+        root_logger.setLevel(logging.DEBUG)  # 根记录器设为最低级别，由handler控制过滤
+        
+        # 清除可能存在的旧处理器，确保配置的纯净性
+        root_logger.handlers.clear()
+        
+        # 日志记录不使用线程名、进程信息，关闭采集以减少每条记录的开销
+        logging.logThreads = False
+        logging.logProcesses = False
+        logging.logMultiprocessing = False
+        
+        # 配置控制台日志处理器：根据verbose模式动态调整显示级别
+        if enable_console_logging:
+            console_handler = create_console_handler(create_console_formatter(), verbose_mode)
+            root_logger.addHandler(console_handler)
+        
+        # 配置文件日志处理器：始终记录详细的DEBUG级别信息
+        # 文件处理器不直接挂到根记录器上，而是经由队列交给后台线程写入，
+        # 避免每次记录日志都在调用线程中等待磁盘I/O
+        if enable_file_logging:
+            file_formatter = JsonFormatter() if json_file_logging else create_file_formatter()
+            file_handler = create_file_handler(file_formatter)
+            if file_handler:
+                log_queue = queue.SimpleQueue()
+                root_logger.addHandler(logging.handlers.QueueHandler(log_queue))
+                _file_log_listener = _BatchingQueueListener(
+                    log_queue, file_handler, respect_handler_level=True
+                )
+                _file_log_listener.start()
+                # 程序退出时停止监听线程，确保队列中剩余的日志全部写入文件
+                atexit.register(_file_log_listener.stop)
+        
+        # 配置第三方库的日志级别，避免过多的第三方调试信息干扰
+        configure_third_party_loggers()
+        
+        _logger_initialized = True
     
     # 记录日志系统初始化完成状态，使用INFO级别确保在控制台可见
     logger = get_logger(__name__)
     mode_desc = "详细模式" if verbose_mode else "标准模式"
-    logger.info(f"日志系统初始化完成 - {mode_desc}")
+    logger.info("日志系统初始化完成 - %s", mode_desc)
 
 
-def create_log_formatter():
+def create_file_formatter():
     """
-    创建日志格式器
+    创建文件日志格式器
     
-    定义日志消息的输出格式，包括时间戳、日志级别、
-    模块名称、行号和日志消息等信息。
+    定义文件日志消息的输出格式，包括时间戳、日志级别、
+    模块名称、文件名、行号和日志消息等信息，便于问题排查时定位代码位置。
     
     返回:
         logging.Formatter: 配置好的日志格式器
@@ -109,10 +187,49 @@ def create_log_formatter():
         "%(filename)s:%(lineno)d - %(message)s"
     )
     
-    # 定义时间格式
-    date_format = "%Y-%m-%d %H:%M:%S"
+    return logging.Formatter(log_format, _LOG_DATE_FORMAT)
+
+
+def create_console_formatter():
+    """
+    创建控制台日志格式器
+    
+    控制台只需要简洁的信息，不包含文件名和行号；
+    需要定位代码位置时请查看文件日志。
     
-    return logging.Formatter(log_format, date_format)
+    返回:
+        logging.Formatter: 配置好的日志格式器
+    """
+    log_format = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+    
+    return logging.Formatter(log_format, _LOG_DATE_FORMAT)
+
+
+class JsonFormatter(logging.Formatter):
+    """
+    JSON行格式的日志格式器
+    
+    每条日志输出为一行JSON，字段包括时间戳、级别、记录器名称、文件名、行号和消息。
+    安装了orjson时使用其C实现序列化，否则回退到标准库json。
+    """
+    
+    def format(self, record):
+        data = {
+            "ts": record.created,
+            "lvl": record.levelname,
+            "name": record.name,
+            "file": record.filename,
+            "line": record.lineno,
+            "msg": record.getMessage(),
+        }
+        if record.exc_info and not record.exc_text:
+            record.exc_text = self.formatException(record.exc_info)
+        if record.exc_text:
+            data["exc"] = record.exc_text
+        
+        if orjson is not None:
+            return orjson.dumps(data).decode('utf-8')
+        return json.dumps(data, ensure_ascii=False)
 
 
 def create_console_handler(formatter, verbose_mode=False):
@@ -192,11 +309,11 @@ def create_file_handler(formatter):
                 with open(log_file_path, 'w', encoding='utf-8') as f:
                     f.write('')  # 写入空内容，清空文件
             except Exception as clear_error:
-                print(f"清空旧日志文件失败: {clear_error}")
+                sys.stderr.write("清空旧日志文件失败: %s\n" % clear_error)
         
-        # 创建普通文件处理器，不使用轮转功能
+        # 创建批量刷新的文件处理器，不使用轮转功能
         # 每次启动都是全新的日志文件，避免累积过大
-        file_handler = logging.FileHandler(
+        file_handler = _BatchedFileHandler(
             log_file_path,
             mode='w',  # 写入模式，确保文件从头开始
             encoding='utf-8'
@@ -210,8 +327,8 @@ def create_file_handler(formatter):
         return file_handler
         
     except Exception as e:
-        # 使用print而不是logger，避免在日志系统初始化时产生循环依赖
-        print(f"创建文件日志处理器失败: {e}")
+        # 直接写stderr而不是logger，避免在日志系统初始化时产生循环依赖
+        sys.stderr.write("创建文件日志处理器失败: %s\n" % e)
         return None
 
 
@@ -253,21 +370,17 @@ def get_logger(name):
         >>> logger = get_logger(__name__)
         >>> logger.info("这是一条信息日志")
     """
-    global _loggers
-    
     # 如果日志系统未初始化，先进行初始化
     if not _logger_initialized:
         setup_logging()
     
-    # 检查是否已经创建过该日志记录器
-    if name in _loggers:
-        return _loggers[name]
-    
-    # 创建新的日志记录器
-    logger = logging.getLogger(name)
-    _loggers[name] = logger
-    
-    return logger
+    return _get_logger_cached(name)
+
+
+@functools.lru_cache(maxsize=None)
+def _get_logger_cached(name):
+    """按名称缓存日志记录器实例，重复获取时直接命中缓存"""
+    return logging.getLogger(name)
 
 
 def log_function_call(func):
@@ -287,33 +400,33 @@ def log_function_call(func):
         def my_function():
             pass
     """
-    import functools
-    import time
-    
     @functools.wraps(func)
     def wrapper(*args, **kwargs):
         logger = get_logger(func.__module__)
+        # DEBUG未启用时跳过调试日志，并使用%格式延迟到真正输出时才格式化消息
+        debug_enabled = logger.isEnabledFor(logging.DEBUG)
         
-        # 记录函数调用开始
-        start_time = time.time()
-        logger.debug(f"调用函数: {func.__name__}")
+        # 记录函数调用开始（perf_counter为单调高精度计时器，不受系统时间调整影响）
+        start_time = time.perf_counter()
+        if debug_enabled:
+            logger.debug("调用函数: %s", func.__name__)
         
         try:
             # 执行原函数
             result = func(*args, **kwargs)
             
             # 记录函数调用成功
-            end_time = time.time()
-            execution_time = end_time - start_time
-            logger.debug(f"函数 {func.__name__} 执行完成，耗时: {execution_time:.3f}秒")
+            if debug_enabled:
+                execution_time = time.perf_counter() - start_time
+                logger.debug("函数 %s 执行完成，耗时: %.3f秒", func.__name__, execution_time)
             
             return result
             
         except Exception as e:
             # 记录函数调用异常
-            end_time = time.time()
+            end_time = time.perf_counter()
             execution_time = end_time - start_time
-            logger.error(f"函数 {func.__name__} 执行失败，耗时: {execution_time:.3f}秒，错误: {e}")
+            logger.error("函数 %s 执行失败，耗时: %.3f秒，错误: %s", func.__name__, execution_time, e)
             raise
     
     return wrapper
@@ -359,22 +472,19 @@ def clear_old_logs(days_to_keep=30):
     """
     try:
         log_dir = os.path.dirname(get_log_file_path())
-        current_time = datetime.now()
+        # 文件年龄的整天数超过days_to_keep即删除，等价于创建时间早于该截止时间戳
+        cutoff_time = time.time() - (days_to_keep + 1) * 86400
         
-        for filename in os.listdir(log_dir):
-            if filename.startswith("flowdesk.log"):
-                file_path = os.path.join(log_dir, filename)
-                file_time = datetime.fromtimestamp(os.path.getctime(file_path))
-                
-                # 计算文件年龄
-                age_days = (current_time - file_time).days
-                
-                if age_days > days_to_keep:
-                    os.remove(file_path)
-                    print(f"删除旧日志文件: {filename}")
+        # scandir返回的目录项自带路径并缓存stat结果，无需为每个文件重新拼接路径和stat
+        with os.scandir(log_dir) as entries:
+            for entry in entries:
+                if entry.name.startswith("flowdesk.log"):
+                    if entry.stat().st_ctime <= cutoff_time:
+                        os.remove(entry.path)
+                        sys.stderr.write("删除旧日志文件: %s\n" % entry.name)
                     
     except Exception as e:
-        print(f"清理旧日志文件失败: {e}")
+        sys.stderr.write("清理旧日志文件失败: %s\n" % e)
 
 
 def set_log_level(level):
@@ -390,4 +500,4 @@ def set_log_level(level):
     root_logger.setLevel(level)
     
     logger = get_logger(__name__)
-    logger.info(f"日志级别已设置为: {logging.getLevelName(level)}")
+    logger.info("日志级别已设置为: %s", logging.getLevelName(level))
@@ -18,14 +18,29 @@ MAC地址格式处理工具类
 - 异常安全：提供详细的错误信息和异常处理
 """
 
-import re
+import functools
+import os
 from typing import Optional, Tuple
 from dataclasses import dataclass
 
 
-@dataclass
+# MAC地址分隔符删除表：str.translate按字符删除分隔符，无需经过正则引擎
+_SEP_TRANS = str.maketrans('', '', ':-')
+# 十六进制字符删除表：删除后为空串即说明全部字符都是十六进制数字
+_HEX_TRANS = str.maketrans('', '', '0123456789ABCDEFabcdef')
+
+# MAC地址显示格式化函数表：格式类型 -> 由6字节地址生成显示字符串的函数
+_DISPLAY_FORMATTERS = {
+    'colon': lambda raw: raw.hex(':').upper(),                    # 00:1A:2B:3C:4D:5E
+    'dash': lambda raw: raw.hex('-').upper(),                     # 00-1A-2B-3C-4D-5E
+    'three_groups': lambda raw: raw.hex('-', 2).upper(),          # 001A-2B3C-4D5E
+    'continuous': lambda raw: raw.hex().upper(),                  # 001A2B3C4D5E
+}
+
+
+@dataclass(frozen=True)
 class MacValidationResult:
-    """MAC地址验证结果数据类"""
+    """MAC地址验证结果数据类（不可变，缓存的结果可安全地在调用方之间共享）"""
     is_valid: bool
     normalized_mac: Optional[str] = None
     error_message: Optional[str] = None
@@ -35,7 +50,7 @@ class MacValidationResult:
 class MacAddressUtils:
     """MAC地址格式处理工具类"""
     
-    # MAC地址格式正则表达式模式
+    # MAC地址格式正则表达式模式（仅作格式说明，检测逻辑见_detect_mac_format）
     MAC_PATTERNS = {
         'colon': r'^([0-9A-Fa-f]{2}[:]){5}([0-9A-Fa-f]{2})$',           # 00:1A:2B:3C:4D:5E
         'dash': r'^([0-9A-Fa-f]{2}[-]){5}([0-9A-Fa-f]{2})$',            # 00-1A-2B-3C-4D-5E
@@ -60,6 +75,23 @@ class MacAddressUtils:
                 error_message="MAC地址不能为空"
             )
         
+        return MacAddressUtils._normalize_cached(mac_input)
+    
+    @staticmethod
+    @functools.lru_cache(maxsize=1024)
+    def _normalize_cached(mac_input: str) -> MacValidationResult:
+        """
+        标准化MAC地址格式的缓存实现
+        
+        标准化是输入字符串的纯函数，网卡枚举和界面逐键验证会反复传入相同的值，
+        因此按输入字符串缓存验证结果。
+        
+        Args:
+            mac_input: 非空的MAC地址字符串
+            
+        Returns:
+            MacValidationResult: 包含验证结果和标准化MAC地址
+        """
         # 去除首尾空格并转换为大写
         mac_clean = mac_input.strip().upper()
         
@@ -77,23 +109,8 @@ class MacAddressUtils:
             )
         
         try:
-            # 移除所有分隔符，获取纯净的12位十六进制字符串
-            clean_mac = re.sub(r'[:-]', '', mac_clean)
-            
-            # 验证长度和字符有效性
-            if len(clean_mac) != 12:
-                return MacValidationResult(
-                    is_valid=False,
-                    error_message=f"MAC地址长度错误，应为12位十六进制字符，当前为{len(clean_mac)}位",
-                    original_format=original_format
-                )
-            
-            if not re.match(r'^[0-9A-F]{12}$', clean_mac):
-                return MacValidationResult(
-                    is_valid=False,
-                    error_message="MAC地址包含无效字符，只能包含0-9和A-F",
-                    original_format=original_format
-                )
+            # 格式检测已确认去掉分隔符后恰好是12位十六进制字符，无需再次验证长度和字符
+            clean_mac = mac_clean.translate(_SEP_TRANS)
             
             # 检查是否为广播地址或多播地址
             if clean_mac == 'FFFFFFFFFFFF':
@@ -111,8 +128,9 @@ class MacAddressUtils:
                 )
             
             # 检查是否为多播地址（第一个字节的最低位为1）
-            first_byte = int(clean_mac[:2], 16)
-            if first_byte & 1:
+            # 已确认为12位十六进制，一次性转换为6字节，后续检查和格式化直接基于字节进行
+            raw_mac = bytes.fromhex(clean_mac)
+            if raw_mac[0] & 1:
                 return MacValidationResult(
                     is_valid=False,
                     error_message="不能使用多播MAC地址（第一个字节必须为偶数）",
@@ -120,7 +138,7 @@ class MacAddressUtils:
                 )
             
             # 转换为标准格式（冒号分隔）
-            normalized_mac = ':'.join([clean_mac[i:i+2] for i in range(0, 12, 2)])
+            normalized_mac = raw_mac.hex(':').upper()
             
             return MacValidationResult(
                 is_valid=True,
@@ -146,9 +164,23 @@ class MacAddressUtils:
         Returns:
             str: 格式类型名称，如果不匹配任何格式则返回None
         """
-        for format_name, pattern in MacAddressUtils.MAC_PATTERNS.items():
-            if re.match(pattern, mac_address):
-                return format_name
+        # 去掉分隔符后必须恰好是12位十六进制字符
+        hex_digits = mac_address.translate(_SEP_TRANS)
+        if len(hex_digits) != 12 or hex_digits.translate(_HEX_TRANS):
+            return None
+        
+        # 十六进制部分已确认，再按总长度和分隔符位置区分格式
+        length = len(mac_address)
+        if length == 12:
+            return 'continuous'
+        if length == 17:
+            separators = mac_address[2::3]
+            if separators == ':::::':
+                return 'colon'
+            if separators == '-----':
+                return 'dash'
+        elif length == 14 and mac_address[4] == '-' and mac_address[9] == '-':
+            return 'three_groups'
         return None
     
     @staticmethod
@@ -166,20 +198,25 @@ class MacAddressUtils:
         if not mac_address:
             return ""
         
-        # 移除分隔符获取纯净字符串
-        clean_mac = re.sub(r'[:-]', '', mac_address.upper())
+        # 移除分隔符获取纯净字符串；已是12位连续字符时（如标准化结果去掉分隔符后复用）无需再处理
+        mac_upper = mac_address.upper()
+        if len(mac_upper) == 12 and mac_upper.isalnum():
+            clean_mac = mac_upper
+        else:
+            clean_mac = mac_upper.translate(_SEP_TRANS)
         
-        if format_type == 'colon':
-            return ':'.join([clean_mac[i:i+2] for i in range(0, 12, 2)])
-        elif format_type == 'dash':
-            return '-'.join([clean_mac[i:i+2] for i in range(0, 12, 2)])
-        elif format_type == 'three_groups':
+        # 合法的12位十六进制地址转换为字节后查表格式化，未知格式类型默认使用冒号分隔格式
+        if len(clean_mac) == 12 and not clean_mac.translate(_HEX_TRANS):
+            formatter = _DISPLAY_FORMATTERS.get(format_type, _DISPLAY_FORMATTERS['colon'])
+            return formatter(bytes.fromhex(clean_mac))
+        
+        # 非标准输入按原样切分，尽量给出可读的显示结果
+        if format_type == 'three_groups':
             return f"{clean_mac[:4]}-{clean_mac[4:8]}-{clean_mac[8:]}"
-        elif format_type == 'continuous':
+        if format_type == 'continuous':
             return clean_mac
-        else:
-            # 默认返回冒号分隔格式
-            return ':'.join([clean_mac[i:i+2] for i in range(0, 12, 2)])
+        separator = '-' if format_type == 'dash' else ':'
+        return separator.join([clean_mac[i:i+2] for i in range(0, 12, 2)])
     
     @staticmethod
     def is_valid_mac_format(mac_address: str) -> bool:
@@ -203,15 +240,12 @@ class MacAddressUtils:
         Returns:
             str: 随机生成的MAC地址（冒号分隔格式）
         """
-        import random
+        # 一次性从系统随机源获取6个字节
+        mac_bytes = bytearray(os.urandom(6))
         
         # 生成本地管理的MAC地址（第一个字节的第二位设为1）
         # 这确保生成的MAC地址不会与厂商分配的地址冲突
-        first_byte = random.randint(0, 255) | 0x02  # 设置本地管理位
-        first_byte = first_byte & 0xFE  # 清除多播位，确保是单播地址
-        
-        # 生成其余5个字节
-        mac_bytes = [first_byte] + [random.randint(0, 255) for _ in range(5)]
+        mac_bytes[0] = (mac_bytes[0] | 0x02) & 0xFE  # 设置本地管理位并清除多播位，确保是单播地址
         
         # 转换为冒号分隔的十六进制格式
-        return ':'.join([f'{byte:02X}' for byte in mac_bytes])
+        return mac_bytes.hex(':').upper()
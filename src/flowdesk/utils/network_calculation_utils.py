@@ -3,15 +3,28 @@
 网络计算工具｜专门负责网络信息计算、ipconfig解析和网络接口数据处理
 """
 import re
+import functools
 import ipaddress
 import logging
+import socket
+import struct
 from typing import Optional, List, Dict
-from dataclasses import dataclass
-from .ip_validation_utils import validate_ip_address, subnet_mask_to_cidr
+from dataclasses import dataclass, field
+from .ip_validation_utils import validate_ip_address, subnet_mask_to_cidr, cidr_to_subnet_mask
 
 # 获取日志记录器
 logger = logging.getLogger(__name__)
 
+# 预编译的正则表达式，避免解析ipconfig输出时每一行都经过re模块的缓存查找
+# IPv4地址（点分四段数字）
+_IPV4_RE = re.compile(r'(\d+\.\d+\.\d+\.\d+)')
+# MAC地址：支持 AA:BB:CC:DD:EE:FF 和 AA-BB-CC-DD-EE-FF 格式
+_MAC_RE = re.compile(r'([0-9A-Fa-f]{2}[:-]){5}([0-9A-Fa-f]{2})')
+
+# 预编译的32位大端整数打包器及绑定方法，避免每次调用重复解析格式串和查找属性
+_pack_u32 = struct.Struct('!I').pack
+_inet_ntoa = socket.inet_ntoa
+
 
 @dataclass
 class NetworkInterface:
@@ -38,13 +51,14 @@ class NetworkInterface:
     ip_address: str = ""
     subnet_mask: str = ""
     gateway: str = ""
-    dns_servers: List[str] = None
+    dns_servers: List[str] = field(default_factory=list)
     dhcp_enabled: bool = True
     status: str = "未知"
-    
-    def __post_init__(self):
-        if self.dns_servers is None:
-            self.dns_servers = []
+
+
+def _int_to_ipv4(value: int) -> str:
+    """将32位整数转换为点分十进制IPv4地址字符串"""
+    return _inet_ntoa(_pack_u32(value))
 
 
 def calculate_network_info(ip: str, mask: str) -> Dict[str, str]:
@@ -80,35 +94,44 @@ def calculate_network_info(ip: str, mask: str) -> Dict[str, str]:
         # 处理CIDR格式的子网掩码
         if mask.startswith('/'):
             cidr = int(mask[1:])
-            network_str = f"{ip}/{cidr}"
+            if not 0 <= cidr <= 32:
+                raise ValueError(f"无效的CIDR值: {cidr}")
         else:
             cidr = subnet_mask_to_cidr(mask)
             if cidr == -1:
                 raise ValueError("无效的子网掩码")
-            network_str = f"{ip}/{cidr}"
+        network_str = f"{ip}/{cidr}"
+        
+        # 只解析一次IP地址，之后全部使用32位整数运算，
+        # 避免构造网络对象并逐个生成主机地址（/16网络就有65534个地址对象）
+        ip_str = str(ip)
+        if '/' in ip_str:
+            raise ValueError(f"无效的IP地址: {ip_str}")
+        ip_int = int(ipaddress.IPv4Address(ip_str))
         
-        # 创建网络对象
-        network = ipaddress.IPv4Network(network_str, strict=False)
+        num_addresses = 1 << (32 - cidr)
+        network_int = ip_int & ~(num_addresses - 1)
+        broadcast_int = network_int + num_addresses - 1
         
         # 计算网络信息
-        result['network'] = str(network.network_address)
-        result['broadcast'] = str(network.broadcast_address)
-        result['netmask'] = str(network.netmask)
-        result['cidr'] = f"/{network.prefixlen}"
+        result['network'] = _int_to_ipv4(network_int)
+        result['broadcast'] = _int_to_ipv4(broadcast_int)
+        result['netmask'] = cidr_to_subnet_mask(cidr)
+        result['cidr'] = f"/{cidr}"
         
         # 计算主机地址范围
-        hosts = list(network.hosts())
-        if hosts:
-            result['first_host'] = str(hosts[0])
-            result['last_host'] = str(hosts[-1])
-            result['usable_hosts'] = str(len(hosts))
+        if cidr < 31:
+            # 去掉网络地址和广播地址
+            result['first_host'] = _int_to_ipv4(network_int + 1)
+            result['last_host'] = _int_to_ipv4(broadcast_int - 1)
+            result['usable_hosts'] = str(num_addresses - 2)
         else:
-            # 对于/31和/32网络
-            result['first_host'] = str(network.network_address)
-            result['last_host'] = str(network.broadcast_address)
-            result['usable_hosts'] = "0" if network.prefixlen == 32 else "2"
+            # 对于/31（点对点链路，两个地址均可用）和/32（单个主机）网络
+            result['first_host'] = result['network']
+            result['last_host'] = result['broadcast']
+            result['usable_hosts'] = str(num_addresses)
         
-        result['total_hosts'] = str(network.num_addresses)
+        result['total_hosts'] = str(num_addresses)
         
         logger.debug(f"网络信息计算完成: {network_str}")
         
@@ -156,6 +179,38 @@ def get_default_gateway_for_network(network_ip: str, subnet_mask: str) -> str:
         return ""
 
 
+@functools.lru_cache(maxsize=256)
+def _classify_ipconfig_key(key: str) -> Optional[str]:
+    """
+    识别ipconfig输出中一行的字段类型
+    
+    ipconfig各适配器的字段名完全相同，按字段名缓存识别结果，
+    每个字段名只需做一次关键字匹配。
+    
+    参数说明：
+        key (str): 行中第一个冒号之前的字段名部分
+        
+    返回值：
+        Optional[str]: 'adapter'表示适配器标题行，其余为NetworkInterface的属性名；
+                       无需解析的行返回None
+    """
+    if '适配器' in key or 'adapter' in key.lower():
+        return 'adapter'
+    if 'IPv4' in key and '地址' in key:
+        return 'ip_address'
+    if '子网掩码' in key or 'Subnet Mask' in key:
+        return 'subnet_mask'
+    if '默认网关' in key or 'Default Gateway' in key:
+        return 'gateway'
+    if 'DNS' in key and '服务器' in key:
+        return 'dns_servers'
+    if '物理地址' in key or 'Physical Address' in key:
+        return 'mac_address'
+    if 'DHCP' in key and ('启用' in key or 'Enabled' in key):
+        return 'dhcp_enabled'
+    return None
+
+
 def parse_ipconfig_output(output: str) -> List[NetworkInterface]:
     """
     解析ipconfig命令的输出，提取网络接口信息
@@ -183,52 +238,43 @@ def parse_ipconfig_output(output: str) -> List[NetworkInterface]:
     current_interface = None
     
     try:
-        lines = output.split('\n')
-        
-        for line in lines:
+        # splitlines在C层同时处理\r\n和\n换行，无需额外处理行尾的\r
+        for line in output.splitlines():
             line = line.strip()
             
+            # 每行只在第一个冒号处切分一次：冒号前为字段名，冒号后为字段值
+            key, _, value = line.partition(':')
+            key_kind = _classify_ipconfig_key(key)
+            
             # 检测新的网络适配器
-            if '适配器' in line or 'adapter' in line.lower():
+            if key_kind == 'adapter':
                 if current_interface:
                     interfaces.append(current_interface)
                 
                 # 提取适配器名称
-                adapter_name = line.split(':')[0].strip()
+                adapter_name = key.strip()
                 current_interface = NetworkInterface(name=adapter_name)
                 continue
             
-            if not current_interface:
+            if not current_interface or key_kind is None:
                 continue
             
-            # 解析各种网络参数
-            if 'IPv4' in line and '地址' in line:
-                ip_match = re.search(r'(\d+\.\d+\.\d+\.\d+)', line)
-                if ip_match:
-                    current_interface.ip_address = ip_match.group(1)
-            
-            elif '子网掩码' in line or 'Subnet Mask' in line:
-                mask_match = re.search(r'(\d+\.\d+\.\d+\.\d+)', line)
-                if mask_match:
-                    current_interface.subnet_mask = mask_match.group(1)
-            
-            elif '默认网关' in line or 'Default Gateway' in line:
-                gateway_match = re.search(r'(\d+\.\d+\.\d+\.\d+)', line)
-                if gateway_match:
-                    current_interface.gateway = gateway_match.group(1)
-            
-            elif 'DNS' in line and '服务器' in line:
-                dns_match = re.search(r'(\d+\.\d+\.\d+\.\d+)', line)
-                if dns_match:
-                    current_interface.dns_servers.append(dns_match.group(1))
-            
-            elif '物理地址' in line or 'Physical Address' in line:
-                mac_match = re.search(r'([0-9A-Fa-f]{2}[:-]){5}([0-9A-Fa-f]{2})', line)
+            # 解析各种网络参数，正则只在字段值部分搜索
+            if key_kind == 'mac_address':
+                mac_match = _MAC_RE.search(value)
                 if mac_match:
                     current_interface.mac_address = mac_match.group(0)
             
-            elif 'DHCP' in line and ('启用' in line or 'Enabled' in line):
-                current_interface.dhcp_enabled = '是' in line or 'Yes' in line
+            elif key_kind == 'dhcp_enabled':
+                current_interface.dhcp_enabled = '是' in value or 'Yes' in value
+            
+            else:
+                ip_match = _IPV4_RE.search(value)
+                if ip_match:
+                    if key_kind == 'dns_servers':
+                        current_interface.dns_servers.append(ip_match.group(1))
+                    else:
+                        setattr(current_interface, key_kind, ip_match.group(1))
         
         # 添加最后一个接口
         if current_interface:
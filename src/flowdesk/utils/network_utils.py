@@ -25,8 +25,10 @@ FlowDesk 网络工具函数模块 - 向后兼容层
 # 向后兼容：重新导出所有拆分后的函数和类
 from .ip_validation_utils import (
     validate_ip_address,
+    validate_ip_addresses,
     validate_subnet_mask, 
     validate_mac_address,
+    validate_mac_addresses,
     cidr_to_subnet_mask,
     subnet_mask_to_cidr,
     is_private_ip,
@@ -54,6 +56,29 @@ import logging
 # 获取日志记录器
 logger = logging.getLogger(__name__)
 
+# 公开的向后兼容接口，均为拆分后专业模块中同一对象的重新导出
+__all__ = [
+    'validate_ip_address',
+    'validate_ip_addresses',
+    'validate_subnet_mask',
+    'validate_mac_address',
+    'validate_mac_addresses',
+    'cidr_to_subnet_mask',
+    'subnet_mask_to_cidr',
+    'is_private_ip',
+    'is_valid_port',
+    'format_mac_address',
+    'smart_validate_subnet_mask',
+    'normalize_subnet_mask_for_netsh',
+    'validate_dns_server',
+    'get_recommended_dns_servers',
+    'COMMON_DNS_SERVERS',
+    'NetworkInterface',
+    'calculate_network_info',
+    'get_default_gateway_for_network',
+    'parse_ipconfig_output',
+]
+
 
 # 模块测试代码 - 向后兼容
 if __name__ == "__main__":
@@ -16,13 +16,21 @@
     dll_path = get_asset_path("LibreHardwareMonitor/LibreHardwareMonitorLib.dll")
 """
 
+import functools
 import os
 import sys
 import platform
 import tempfile
 from pathlib import Path
 
+# 打包环境中建立存在性索引的资源目录（相对于基础路径）
+_INDEXED_RESOURCE_DIRS = ('assets', 'config')
 
+# 本进程中已确保存在的目录，避免每次获取目录都重复makedirs系统调用
+_ENSURED_DIRS = set()
+
+
+@functools.lru_cache(maxsize=1)
 def get_base_path():
     """
     获取应用程序基础路径
@@ -31,6 +39,8 @@ def get_base_path():
     - 开发环境：返回项目根目录
     - 打包环境：返回PyInstaller临时目录
     
+    运行环境在进程生命周期内不会改变，结果只在首次调用时计算。
+    
     返回:
         str: 应用程序基础路径
     """
@@ -43,17 +53,19 @@ def get_base_path():
         current_file = Path(__file__).resolve()
         # 当前文件路径: src/flowdesk/utils/resource_path.py
         # 项目根目录: 向上3级目录
-        base_path = current_file.parent.parent.parent.parent
+        base_path = current_file.parents[3]
     
     return str(base_path)
 
 
+@functools.lru_cache(maxsize=None)
 def resource_path(relative_path):
     """
     获取资源文件的绝对路径
     
     将相对路径转换为绝对路径，支持开发环境和打包环境。
     自动处理路径分隔符的跨平台兼容性。
+    图标、配置等资源路径数量有限且会被反复请求，结果按参数缓存。
     
     参数:
         relative_path (str): 相对于项目根目录的资源路径
@@ -76,6 +88,7 @@ def resource_path(relative_path):
     return os.path.normpath(full_path)
 
 
+@functools.lru_cache(maxsize=None)
 def get_asset_path(asset_relative_path):
     """
     获取assets目录下资源文件的绝对路径
@@ -114,10 +127,39 @@ def check_resource_exists(relative_path):
         >>> check_resource_exists("assets/icons/flowdesk.ico")
         True
     """
+    if getattr(sys, 'frozen', False):
+        # 打包环境的资源集合在构建时已固定，查内存索引，无需stat系统调用
+        normalized = os.path.normcase(os.path.normpath(relative_path))
+        if normalized.split(os.sep, 1)[0] in _INDEXED_RESOURCE_DIRS:
+            return normalized in _get_resource_index()
+    
     full_path = resource_path(relative_path)
     return os.path.exists(full_path)
 
 
+@functools.lru_cache(maxsize=1)
+def _get_resource_index():
+    """
+    构建打包环境的资源存在性索引
+    
+    遍历一次基础路径下的assets和config目录，收集其中所有文件和子目录
+    相对于基础路径的规范化路径，供check_resource_exists查询。
+    
+    返回:
+        frozenset: 规范化后的相对路径集合
+    """
+    base_path = get_base_path()
+    index = set()
+    for resource_dir in _INDEXED_RESOURCE_DIRS:
+        for root, dirs, filenames in os.walk(os.path.join(base_path, resource_dir)):
+            rel_root = os.path.relpath(root, base_path)
+            index.add(os.path.normcase(rel_root))
+            for name in dirs + filenames:
+                index.add(os.path.normcase(os.path.join(rel_root, name)))
+    return frozenset(index)
+
+
+@functools.lru_cache(maxsize=None)
 def get_config_path(config_filename):
     """
     获取配置文件的绝对路径
@@ -134,10 +176,13 @@ def get_config_path(config_filename):
     return resource_path(f"config/{config_filename}")
 
 
+@functools.lru_cache(maxsize=1)
 def get_project_root():
     """
     获取项目根目录路径
     
+    项目位置在进程生命周期内不会改变，结果只在首次调用时计算。
+    
     返回:
         str: 项目根目录的绝对路径
     """
@@ -145,7 +190,14 @@ def get_project_root():
     current_file = Path(__file__).resolve()
     # 当前文件路径: src/flowdesk/utils/resource_path.py
     # 项目根目录: 向上3级目录
-    return str(current_file.parent.parent.parent.parent)
+    return str(current_file.parents[3])
+
+
+def _ensure_dir(path: str) -> None:
+    """确保目录存在，同一目录在进程内只创建一次"""
+    if path not in _ENSURED_DIRS:
+        os.makedirs(path, exist_ok=True)
+        _ENSURED_DIRS.add(path)
 
 
 def get_logs_dir() -> str:
@@ -184,7 +236,7 @@ def get_logs_dir() -> str:
         log_dir = os.path.join(base_dir, 'logs')
         
         # 确保目录存在
-        os.makedirs(log_dir, exist_ok=True)
+        _ensure_dir(log_dir)
         
         return log_dir
         
@@ -192,7 +244,7 @@ def get_logs_dir() -> str:
         print(f"获取日志目录失败: {e}")
         # 返回临时目录作为备选
         fallback_dir = os.path.join(tempfile.gettempdir(), 'FlowDesk', 'logs')
-        os.makedirs(fallback_dir, exist_ok=True)
+        _ensure_dir(fallback_dir)
         return fallback_dir
 
 
@@ -229,7 +281,7 @@ def get_app_data_dir() -> str:
             data_dir = os.path.join(get_project_root(), 'data')
         
         # 确保目录存在
-        os.makedirs(data_dir, exist_ok=True)
+        _ensure_dir(data_dir)
         
         return data_dir
         
@@ -237,7 +289,7 @@ def get_app_data_dir() -> str:
         print(f"获取应用数据目录失败: {e}")
         # 返回临时目录作为备选
         fallback_dir = os.path.join(tempfile.gettempdir(), 'FlowDesk', 'data')
-        os.makedirs(fallback_dir, exist_ok=True)
+        _ensure_dir(fallback_dir)
         return fallback_dir
 
 
@@ -270,17 +322,34 @@ def list_assets(asset_subdir=""):
     返回:
         list: 资源文件路径列表
     """
+    if getattr(sys, 'frozen', False):
+        # 打包环境的资源在构建时已固定，同一子目录只遍历一次
+        return list(_list_frozen_assets(asset_subdir))
+    
+    return _walk_assets(asset_subdir)
+
+
+@functools.lru_cache(maxsize=None)
+def _list_frozen_assets(asset_subdir):
+    """打包环境下缓存list_assets的遍历结果"""
+    return tuple(_walk_assets(asset_subdir))
+
+
+def _walk_assets(asset_subdir):
+    """遍历assets下指定子目录，返回排序后的相对路径列表"""
     assets_path = resource_path(f"assets/{asset_subdir}")
     
     if not os.path.exists(assets_path):
         return []
     
+    assets_root = resource_path("assets")
     files = []
     for root, dirs, filenames in os.walk(assets_path):
-        for filename in filenames:
-            file_path = os.path.join(root, filename)
-            # 返回相对于assets目录的路径
-            rel_path = os.path.relpath(file_path, resource_path("assets"))
-            files.append(rel_path)
+        # 返回相对于assets目录的路径，每个目录只计算一次相对路径
+        rel_root = os.path.relpath(root, assets_root)
+        if rel_root == os.curdir:
+            files.extend(filenames)
+        else:
+            files.extend(os.path.join(rel_root, filename) for filename in filenames)
     
     return sorted(files)
@@ -25,20 +25,48 @@ FlowDesk 子进程执行助手模块
 - 性能优化：支持异步执行，不阻塞UI线程
 """
 
+import functools
 import subprocess
 import threading
-import queue
 import time
 import os
 import sys
 import logging
-from typing import Optional, List, Dict, Any, Callable, Tuple
-from dataclasses import dataclass
+from typing import Optional, List, Dict, Any, Callable, Tuple, Union
+from dataclasses import dataclass, replace
 from enum import Enum
 
 # 获取日志记录器
 logger = logging.getLogger(__name__)
 
+# 运行平台在进程生命周期内不变，导入时判断一次
+_IS_WINDOWS = sys.platform.startswith('win')
+# 调用方未指定编码（默认utf-8）时实际使用的编码，Windows中文系统默认使用GBK编码
+_DEFAULT_ENCODING = 'gbk' if _IS_WINDOWS else 'utf-8'
+# Windows下不为控制台子进程创建窗口，避免每次执行命令时黑框闪烁
+_CREATE_NO_WINDOW = subprocess.CREATE_NO_WINDOW if hasattr(subprocess, 'CREATE_NO_WINDOW') else 0
+
+# 各平台对应的命令参数，导入时按平台选定，封装函数中不再逐次判断
+if _IS_WINDOWS:
+    _KILL_COMMAND_PREFIX = ['taskkill', '/f', '/im']
+    _PROCESS_IMAGE_SUFFIX = '.exe'
+    _WHICH_COMMAND = 'where'
+    _PING_COUNT_OPTION = '-n'
+    _INTERFACES_COMMAND = ['ipconfig', '/all']
+    _FLUSH_DNS_COMMAND = ['ipconfig', '/flushdns']
+else:
+    _KILL_COMMAND_PREFIX = ['pkill']
+    _PROCESS_IMAGE_SUFFIX = ''
+    _WHICH_COMMAND = 'which'
+    _PING_COUNT_OPTION = '-c'
+    _INTERFACES_COMMAND = ['ifconfig', '-a']
+    _FLUSH_DNS_COMMAND = ['sudo', 'systemctl', 'flush-dns']
+
+# 查询类命令结果的短期缓存：界面多个标签页在短时间内重复查询时共享同一次执行结果
+_RESULT_CACHE_TTL = 0.5  # 缓存有效期（秒）
+_result_cache: Dict[Tuple, Tuple[float, 'CommandResult']] = {}
+_result_cache_lock = threading.Lock()
+
 
 class CommandStatus(Enum):
     """命令执行状态枚举"""
@@ -87,7 +115,7 @@ class CommandResult:
         return self.stdout if self.stdout else self.stderr
 
 
-def run_command(command: str, 
+def run_command(command: Union[str, List[str]], 
                 timeout: int = 30,
                 shell: bool = True,
                 cwd: Optional[str] = None,
@@ -101,9 +129,10 @@ def run_command(command: str,
     例如：获取网络配置信息、检查网络连通性、查询系统状态等。
     
     参数说明：
-        command: 要执行的命令字符串
+        command: 要执行的命令字符串，或配合shell=False使用的参数列表
         timeout: 超时时间（秒），防止命令长时间无响应
         shell: 是否通过shell执行（Windows下通常为True）
+               传入参数列表时应设为False，直接启动目标程序，省去一次cmd.exe进程创建
         cwd: 工作目录，None表示使用当前目录
         env: 环境变量字典，None表示继承当前环境
         encoding: 输出编码格式，Windows中文系统通常用'gbk'
@@ -128,15 +157,19 @@ def run_command(command: str,
             print("网络连接异常")
     """
     start_time = time.time()
-    result = CommandResult(command=command)
+    if not isinstance(command, str):
+        # 参数列表转换为命令行字符串，用于结果记录和日志
+        command_text = subprocess.list2cmdline(command)
+    else:
+        command_text = command
+    result = CommandResult(command=command_text)
     
     try:
-        logger.debug(f"执行命令: {command}")
+        logger.debug(f"执行命令: {command_text}")
         
         # Windows系统编码处理
-        if sys.platform.startswith('win') and encoding == 'utf-8':
-            # Windows中文系统默认使用GBK编码
-            encoding = 'gbk'
+        if encoding == 'utf-8':
+            encoding = _DEFAULT_ENCODING
         
         # 执行命令
         process = subprocess.Popen(
@@ -148,7 +181,8 @@ def run_command(command: str,
             env=env,
             text=True,
             encoding=encoding,
-            errors='replace'  # 遇到编码错误时替换为占位符
+            errors='replace',  # 遇到编码错误时替换为占位符
+            creationflags=_CREATE_NO_WINDOW
         )
         
         result.status = CommandStatus.RUNNING
@@ -169,22 +203,22 @@ def run_command(command: str,
             process.communicate()  # 清理进程
             result.status = CommandStatus.TIMEOUT
             result.error_message = f"命令执行超时（{timeout}秒）"
-            logger.warning(f"命令执行超时: {command}")
+            logger.warning(f"命令执行超时: {command_text}")
             
     except FileNotFoundError:
         result.status = CommandStatus.FAILED
         result.error_message = "命令不存在或无法找到"
-        logger.error(f"命令不存在: {command}")
+        logger.error(f"命令不存在: {command_text}")
         
     except PermissionError:
         result.status = CommandStatus.FAILED
         result.error_message = "权限不足，无法执行命令"
-        logger.error(f"权限不足: {command}")
+        logger.error(f"权限不足: {command_text}")
         
     except Exception as e:
         result.status = CommandStatus.FAILED
         result.error_message = f"命令执行异常: {str(e)}"
-        logger.error(f"命令执行异常: {command}, 错误: {e}")
+        logger.error(f"命令执行异常: {command_text}, 错误: {e}")
     
     finally:
         result.execution_time = time.time() - start_time
@@ -251,10 +285,7 @@ def run_command_async(command: str,
             logger.debug(f"异步执行命令: {command}")
             
             # Windows系统编码处理
-            if sys.platform.startswith('win') and encoding == 'utf-8':
-                encoding_to_use = 'gbk'
-            else:
-                encoding_to_use = encoding
+            encoding_to_use = _DEFAULT_ENCODING if encoding == 'utf-8' else encoding
             
             # 启动进程
             process = subprocess.Popen(
@@ -268,7 +299,8 @@ def run_command_async(command: str,
                 encoding=encoding_to_use,
                 errors='replace',
                 bufsize=1,  # 行缓冲，便于实时输出
-                universal_newlines=True
+                universal_newlines=True,
+                creationflags=_CREATE_NO_WINDOW
             )
             
             result.status = CommandStatus.RUNNING
@@ -277,9 +309,6 @@ def run_command_async(command: str,
             output_lines = []
             error_lines = []
             
-            # 使用队列来处理实时输出
-            output_queue = queue.Queue()
-            
             def _read_output(pipe, line_list, is_stderr=False):
                 """读取输出的内部函数"""
                 try:
@@ -289,9 +318,8 @@ def run_command_async(command: str,
                             line_list.append(line)
                             if progress_callback and not is_stderr:
                                 progress_callback(line)
-                            output_queue.put(('line', line, is_stderr))
                 except Exception as e:
-                    output_queue.put(('error', str(e), is_stderr))
+                    logger.debug(f"读取命令输出异常: {e}")
                 finally:
                     pipe.close()
             
@@ -381,17 +409,69 @@ def run_elevated_command(command: str,
         else:
             print(f"修改失败: {result.error_message}")
     """
-    if sys.platform.startswith('win'):
-        # Windows系统使用PowerShell提升权限
+    logger.info(f"以管理员权限执行命令: {command}")
+    
+    if _IS_WINDOWS:
+        from .admin_utils import can_run_elevated_process
+        
+        if can_run_elevated_process():
+            # Windows系统直接通过ShellExecuteExW提升权限，不再经过PowerShell中转；
+            # 命令可能已经启动，之后的任何异常都不回退，避免再次弹出UAC、命令执行两次
+            return _run_elevated_windows(command, timeout)
+        
+        # 备用方案：ShellExecuteExW不可用时使用PowerShell提升权限
+        logger.warning("ShellExecuteExW不可用，改用PowerShell提升权限")
         elevated_command = f'powershell -Command "Start-Process cmd -ArgumentList \'/c {command}\' -Verb RunAs -Wait"'
     else:
         # Linux/macOS系统使用sudo
         elevated_command = f'sudo {command}'
     
-    logger.info(f"以管理员权限执行命令: {command}")
     return run_command(elevated_command, timeout=timeout)
 
 
+def _run_elevated_windows(command: str, timeout: int) -> CommandResult:
+    """
+    通过ShellExecuteExW以管理员权限执行命令并等待完成
+    
+    提权进程的输出无法捕获，结果只包含返回码和执行状态。
+    
+    参数说明：
+        command: 要执行的命令
+        timeout: 超时时间（秒）
+        
+    返回值：
+        CommandResult: 执行结果
+    """
+    from .admin_utils import run_elevated_process
+    
+    start_time = time.time()
+    result = CommandResult(command=command)
+    
+    try:
+        return_code = run_elevated_process('cmd.exe', f'/c {command}', timeout)
+        if return_code is None:
+            result.status = CommandStatus.FAILED
+            result.error_message = "用户拒绝权限提升或进程启动失败"
+        else:
+            result.return_code = return_code
+            result.status = CommandStatus.COMPLETED
+            
+    except subprocess.TimeoutExpired:
+        result.status = CommandStatus.TIMEOUT
+        result.error_message = f"命令执行超时（{timeout}秒）"
+        logger.warning(f"提权命令执行超时: {command}")
+        
+    except Exception as e:
+        result.status = CommandStatus.FAILED
+        result.error_message = f"提权命令执行异常: {str(e)}"
+        logger.error(f"提权命令执行异常: {command}, 错误: {e}")
+    
+    finally:
+        result.execution_time = time.time() - start_time
+    
+    return result
+
+
 def kill_process_by_name(process_name: str) -> CommandResult:
     """
     根据进程名终止进程
@@ -411,13 +491,10 @@ def kill_process_by_name(process_name: str) -> CommandResult:
         if result.success:
             print("进程终止成功")
     """
-    if sys.platform.startswith('win'):
-        command = f'taskkill /f /im {process_name}.exe'
-    else:
-        command = f'pkill {process_name}'
+    command = _KILL_COMMAND_PREFIX + [process_name + _PROCESS_IMAGE_SUFFIX]
     
     logger.debug(f"终止进程: {process_name}")
-    return run_command(command, timeout=10)
+    return run_command(command, timeout=10, shell=False)
 
 
 def get_command_output(command: str, 
@@ -454,12 +531,14 @@ def get_command_output(command: str,
         return default_value
 
 
+@functools.lru_cache(maxsize=128)
 def is_command_available(command: str) -> bool:
     """
     检查命令是否可用
     
     作用说明：
     在执行命令前检查其可用性，避免执行不存在的命令。
+    命令是否可用在进程生命周期内不会改变，每个命令只启动一次where/which查询。
     
     参数说明：
         command: 要检查的命令名
@@ -473,20 +552,46 @@ def is_command_available(command: str) -> bool:
         else:
             print("ping命令不可用")
     """
-    if sys.platform.startswith('win'):
-        check_command = f'where {command}'
-    else:
-        check_command = f'which {command}'
-    
-    result = run_command(check_command, timeout=5)
+    result = run_command([_WHICH_COMMAND, command], timeout=5, shell=False)
     return result.success
 
 
+def _run_command_cached(cache_key: Tuple, command: List[str], timeout: int) -> CommandResult:
+    """
+    执行查询类命令，有效期内的重复调用直接复用上次结果
+    
+    参数说明：
+        cache_key: 缓存键，相同的键表示相同的查询
+        command: 命令参数列表
+        timeout: 超时时间（秒）
+        
+    返回值：
+        CommandResult: 执行结果的副本，调用方修改不会影响缓存
+    """
+    with _result_cache_lock:
+        cached = _result_cache.get(cache_key)
+    if cached is not None and time.monotonic() - cached[0] < _RESULT_CACHE_TTL:
+        return replace(cached[1])
+    
+    result = run_command(command, timeout=timeout, shell=False)
+    now = time.monotonic()
+    with _result_cache_lock:
+        # 写入时顺便清除已过期的条目，缓存大小不会随查询过的主机数增长
+        expired_keys = [key for key, (timestamp, _) in _result_cache.items()
+                        if now - timestamp >= _RESULT_CACHE_TTL]
+        for key in expired_keys:
+            del _result_cache[key]
+        _result_cache[cache_key] = (now, result)
+    return replace(result)
+
+
 # 常用网络命令的封装函数
 def ping_host(host: str, count: int = 4, timeout: int = 30) -> CommandResult:
     """
     Ping指定主机
     
+    相同主机和次数的请求在0.5秒内重复调用时复用上次结果。
+    
     参数说明：
         host: 目标主机IP或域名
         count: ping次数
@@ -495,27 +600,21 @@ def ping_host(host: str, count: int = 4, timeout: int = 30) -> CommandResult:
     返回值：
         CommandResult: ping结果
     """
-    if sys.platform.startswith('win'):
-        command = f'ping -n {count} {host}'
-    else:
-        command = f'ping -c {count} {host}'
+    command = ['ping', _PING_COUNT_OPTION, str(count), host]
     
-    return run_command(command, timeout=timeout)
+    return _run_command_cached(('ping', host, count), command, timeout)
 
 
 def get_network_interfaces() -> CommandResult:
     """
     获取网络接口信息
     
+    0.5秒内重复调用时复用上次结果，避免重复启动ipconfig进程。
+    
     返回值：
         CommandResult: 网络接口信息
     """
-    if sys.platform.startswith('win'):
-        command = 'ipconfig /all'
-    else:
-        command = 'ifconfig -a'
-    
-    return run_command(command, timeout=15)
+    return _run_command_cached(('interfaces',), _INTERFACES_COMMAND, 15)
 
 
 def flush_dns() -> CommandResult:
@@ -525,12 +624,7 @@ def flush_dns() -> CommandResult:
     返回值：
         CommandResult: 执行结果
     """
-    if sys.platform.startswith('win'):
-        command = 'ipconfig /flushdns'
-    else:
-        command = 'sudo systemctl flush-dns'
-    
-    return run_command(command, timeout=10)
+    return run_command(_FLUSH_DNS_COMMAND, timeout=10, shell=False)
 
 
 # 模块测试代码
@@ -9,9 +9,16 @@
 
 import os
 import datetime
+import functools
 from typing import Tuple
 
+# 版本文件和构建信息文件所在目录（当前文件向上3级，即src目录），导入时计算一次
+_VERSION_FILES_DIR = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+_VERSION_FILE = os.path.join(_VERSION_FILES_DIR, 'VERSION')
+_BUILD_INFO_FILE = os.path.join(_VERSION_FILES_DIR, 'BUILD_INFO')
 
+
+@functools.lru_cache(maxsize=1)
 def get_app_version() -> str:
     """
     获取应用程序版本号
@@ -21,6 +28,8 @@ def get_app_version() -> str:
     2. 版本配置文件
     3. 默认版本号
     
+    版本号在进程生命周期内不变，只在首次调用时读取。
+    
     Returns:
         str: 版本号字符串，格式为 "v1.0.0"
     """
@@ -31,12 +40,8 @@ def get_app_version() -> str:
     
     # 尝试从版本文件读取
     try:
-        version_file = os.path.join(
-            os.path.dirname(os.path.dirname(os.path.dirname(__file__))),
-            'VERSION'
-        )
-        if os.path.exists(version_file):
-            with open(version_file, 'r', encoding='utf-8') as f:
+        if os.path.exists(_VERSION_FILE):
+            with open(_VERSION_FILE, 'r', encoding='utf-8') as f:
                 version = f.read().strip()
                 return f"v{version}" if not version.startswith('v') else version
     except Exception:
@@ -47,12 +52,14 @@ def get_app_version() -> str:
     return "v1.0.0"
 
 
+@functools.lru_cache(maxsize=1)
 def get_build_date() -> str:
     """
     获取构建日期
     
     在开发环境中返回当前系统日期，
     在生产环境中可以从构建信息中获取实际构建日期。
+    结果只在首次调用时获取，之后保持不变。
     
     Returns:
         str: 构建日期字符串，格式为 "YYYY-MM-DD"
@@ -64,12 +71,8 @@ def get_build_date() -> str:
     
     # 尝试从构建信息文件读取
     try:
-        build_info_file = os.path.join(
-            os.path.dirname(os.path.dirname(os.path.dirname(__file__))),
-            'BUILD_INFO'
-        )
-        if os.path.exists(build_info_file):
-            with open(build_info_file, 'r', encoding='utf-8') as f:
+        if os.path.exists(_BUILD_INFO_FILE):
+            with open(_BUILD_INFO_FILE, 'r', encoding='utf-8') as f:
                 return f.read().strip()
     except Exception:
         # 构建信息文件读取失败，使用当前日期
@@ -79,6 +82,7 @@ def get_build_date() -> str:
     return datetime.datetime.now().strftime("%Y-%m-%d")
 
 
+@functools.lru_cache(maxsize=1)
 def get_version_info() -> Tuple[str, str]:
     """
     获取完整的版本信息
@@ -10,6 +10,7 @@
 - test_capabilities.py: 系统能力检测测试
 - test_subprocess_helper.py: 子进程管理工具测试
 - test_network_utils.py: 网络工具函数测试
+- test_ip_validation_utils.py: IP与子网掩码验证测试
 - test_registry_helper.py: 注册表操作工具测试
 - test_encryption.py: 加密工具测试
 """
@@ -0,0 +1,63 @@
+# -*- coding: utf-8 -*-
+"""
+ip_validation_utils 子网掩码解析单元测试
+
+测试智能子网掩码验证与netsh标准化：
+- 纯数字、CIDR、点分十进制三种格式的转换
+- Unicode数字字符（如'²'）不会导致异常
+- /0 前缀不会被转换为0.0.0.0交给netsh
+- MAC地址格式化支持非ASCII分隔符
+"""
+
+import unittest
+
+from src.flowdesk.utils.ip_validation_utils import (
+    smart_validate_subnet_mask,
+    normalize_subnet_mask_for_netsh,
+    format_mac_address,
+)
+
+
+class TestSubnetMaskParsing(unittest.TestCase):
+    """子网掩码解析测试类"""
+
+    def test_supported_formats(self):
+        """测试三种输入格式均被正确标准化"""
+        self.assertEqual(normalize_subnet_mask_for_netsh("24"), "255.255.255.0")
+        self.assertEqual(normalize_subnet_mask_for_netsh("/16"), "255.255.0.0")
+        self.assertEqual(normalize_subnet_mask_for_netsh("255.255.255.0"), "255.255.255.0")
+        self.assertTrue(smart_validate_subnet_mask("24"))
+        self.assertTrue(smart_validate_subnet_mask("/16"))
+        self.assertTrue(smart_validate_subnet_mask("255.255.255.0"))
+
+    def test_unicode_digits_rejected(self):
+        """测试isdigit为True但int()无法转换的字符返回无效而非抛出异常"""
+        for mask in ("²", "0²", "/²"):
+            self.assertFalse(smart_validate_subnet_mask(mask), mask)
+            self.assertEqual(normalize_subnet_mask_for_netsh(mask), mask)
+
+    def test_zero_prefix(self):
+        """测试/0验证有效，但标准化时原样返回"""
+        self.assertTrue(smart_validate_subnet_mask("/0"))
+        self.assertEqual(normalize_subnet_mask_for_netsh("/0"), "/0")
+        self.assertFalse(smart_validate_subnet_mask("0"))
+        self.assertEqual(normalize_subnet_mask_for_netsh("0"), "0")
+
+
+
+class TestFormatMacAddress(unittest.TestCase):
+    """MAC地址格式化测试类"""
+
+    def test_ascii_separators(self):
+        """测试常见ASCII分隔符"""
+        self.assertEqual(format_mac_address("aa-bb-cc-dd-ee-ff"), "AA:BB:CC:DD:EE:FF")
+        self.assertEqual(format_mac_address("AA:BB:CC:DD:EE:FF", "-"), "AA-BB-CC-DD-EE-FF")
+
+    def test_non_ascii_separator(self):
+        """测试全角冒号等非ASCII分隔符正常插入，而非返回原始输入"""
+        self.assertEqual(format_mac_address("AA:BB:CC:DD:EE:FF", "："),
+                         "AA：BB：CC：DD：EE：FF")
+
+
+if __name__ == '__main__':
+    unittest.main()
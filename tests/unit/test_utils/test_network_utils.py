@@ -0,0 +1,38 @@
+# -*- coding: utf-8 -*-
+"""
+network_utils 向后兼容层单元测试
+
+测试拆包后的兼容模块：
+- 所有公开接口均可从network_utils导入
+- 重新导出的对象与专业模块中的实现是同一对象，不存在旧的重复实现
+"""
+
+import unittest
+
+from src.flowdesk.utils import network_utils
+from src.flowdesk.utils import ip_validation_utils, dns_utils, network_calculation_utils
+
+
+class TestNetworkUtilsReexports(unittest.TestCase):
+    """network_utils 重新导出测试类"""
+    
+    def test_all_names_exported(self):
+        """测试__all__中的名称均可从模块获取"""
+        for name in network_utils.__all__:
+            self.assertTrue(hasattr(network_utils, name), name)
+    
+    def test_reexports_are_same_objects(self):
+        """测试重新导出的函数与专业模块中的实现为同一对象"""
+        source_modules = (ip_validation_utils, dns_utils, network_calculation_utils)
+        for name in network_utils.__all__:
+            sources = [module for module in source_modules if hasattr(module, name)]
+            self.assertTrue(sources, name)
+            self.assertIs(getattr(network_utils, name), getattr(sources[0], name), name)
+    
+    def test_validate_ip_address_is_shared(self):
+        """测试IP验证函数未被重复实现"""
+        self.assertIs(network_utils.validate_ip_address, ip_validation_utils.validate_ip_address)
+
+
+if __name__ == '__main__':
+    unittest.main()